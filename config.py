@@ -16,6 +16,33 @@ class _Config:
         if self._words_generation_interval < 5:
             raise ValueError("WORDS_GENERATION_INTERVAL must be at least 5")
 
+        self._words_generation_batch_size = int(
+            os.getenv("WORDS_GENERATION_BATCH_SIZE", 100)
+        )
+        if not 1 <= self._words_generation_batch_size <= 100:
+            raise ValueError("WORDS_GENERATION_BATCH_SIZE must be between 1 and 100")
+
+        self._words_pool_low_watermark = int(os.getenv("WORDS_POOL_LOW_WATERMARK", 500))
+        self._words_pool_high_watermark = int(
+            os.getenv("WORDS_POOL_HIGH_WATERMARK", 5000)
+        )
+        if self._words_pool_low_watermark >= self._words_pool_high_watermark:
+            raise ValueError(
+                "WORDS_POOL_LOW_WATERMARK must be less than WORDS_POOL_HIGH_WATERMARK"
+            )
+
+        self._words_pool_freshness_hours = int(
+            os.getenv("WORDS_POOL_FRESHNESS_HOURS", 24)
+        )
+        if self._words_pool_freshness_hours < 1:
+            raise ValueError("WORDS_POOL_FRESHNESS_HOURS must be at least 1")
+
+        self._polly_requests_per_second = float(
+            os.getenv("POLLY_REQUESTS_PER_SECOND", 8)
+        )
+        if self._polly_requests_per_second <= 0:
+            raise ValueError("POLLY_REQUESTS_PER_SECOND must be greater than 0")
+
         self._apigw_custom_header_ssm_parameter = os.getenv(
             "APIGW_CUSTOM_HEADER_SSM_PARAMETER"
         )
@@ -24,6 +51,28 @@ class _Config:
 
         self._apigw_custom_header_name = "X-apigw-cloudfront-token"
 
+        self._questions_mode = os.getenv("QUESTIONS_MODE", "direct")
+        if self._questions_mode not in ("direct", "deck", "state_machine"):
+            raise ValueError(
+                "QUESTIONS_MODE must be one of direct, deck or state_machine"
+            )
+
+        self._audio_delivery = os.getenv("AUDIO_DELIVERY", "presigned")
+        if self._audio_delivery not in ("presigned", "cloudfront"):
+            raise ValueError("AUDIO_DELIVERY must be one of presigned or cloudfront")
+
+        self._audio_signing_public_key_file = os.getenv("AUDIO_SIGNING_PUBLIC_KEY_FILE")
+        self._audio_signing_private_key_ssm_parameter = os.getenv(
+            "AUDIO_SIGNING_PRIVATE_KEY_SSM_PARAMETER"
+        )
+        if self._audio_delivery == "cloudfront":
+            if not self._audio_signing_public_key_file or not os.path.isfile(
+                self._audio_signing_public_key_file
+            ):
+                raise RuntimeError("AUDIO_SIGNING_PUBLIC_KEY_FILE is missing")
+            if not self._audio_signing_private_key_ssm_parameter:
+                raise RuntimeError("AUDIO_SIGNING_PRIVATE_KEY_SSM_PARAMETER is not set")
+
     @staticmethod
     def _parse_environment_files() -> None:
         """Load the .env file."""
@@ -53,6 +102,51 @@ class BaseConfig(_Config):
         """Read-only property for words_generation_interval."""
         return self._words_generation_interval
 
+    @property
+    def questions_mode(self) -> str:
+        """How /questions are assembled: direct, deck or state_machine."""
+        return self._questions_mode
+
+    @property
+    def words_generation_batch_size(self) -> int:
+        """Number of words asked from the model per generation run."""
+        return self._words_generation_batch_size
+
+    @property
+    def words_pool_low_watermark(self) -> int:
+        """Words per language below which generation always runs."""
+        return self._words_pool_low_watermark
+
+    @property
+    def words_pool_high_watermark(self) -> int:
+        """Words per language at which generation stops."""
+        return self._words_pool_high_watermark
+
+    @property
+    def words_pool_freshness_hours(self) -> int:
+        """Hours after which a pool in use gets new words."""
+        return self._words_pool_freshness_hours
+
+    @property
+    def polly_requests_per_second(self) -> float:
+        """Polly requests per second shared by all words generation runs."""
+        return self._polly_requests_per_second
+
+    @property
+    def audio_delivery(self) -> str:
+        """How word audio is served: "presigned" S3 URLs or "cloudfront"."""
+        return self._audio_delivery
+
+    @property
+    def audio_signing_public_key_file(self) -> str:
+        """PEM public key file of the CloudFront audio signing key pair."""
+        return self._audio_signing_public_key_file
+
+    @property
+    def audio_signing_private_key_ssm_parameter(self) -> str:
+        """SSM secure parameter holding the PEM private key of the key pair."""
+        return self._audio_signing_private_key_ssm_parameter
+
     @property
     def apigw_custom_header_ssm_parameter(self) -> str:
         """Get the SSM secure parameter name."""
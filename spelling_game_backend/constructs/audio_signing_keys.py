@@ -0,0 +1,44 @@
+"""Construct for AudioSigningKeys."""
+
+from aws_cdk import (
+    Stack,
+    aws_cloudfront as cloudfront,
+    aws_ssm as ssm,
+)
+from constructs import Construct
+from config import BaseConfig
+
+
+class AudioSigningKeys(Construct):
+    """Key pair that signs the cookies granting access to word audio."""
+
+    def __init__(self, scope: Stack, construct_id: str, **kwargs) -> None:
+        """Construct a new AudioSigningKeys."""
+        super().__init__(scope=scope, id=construct_id, **kwargs)
+
+        config = BaseConfig()
+
+        with open(config.audio_signing_public_key_file, encoding="utf-8") as f:
+            encoded_key = f.read()
+
+        self.public_key = cloudfront.PublicKey(
+            self,
+            "AudioSigningPublicKey",
+            encoded_key=encoded_key,
+            comment="Verifies the signed cookies of word audio",
+        )
+
+        self.key_group = cloudfront.KeyGroup(
+            self,
+            "AudioSigningKeyGroup",
+            items=[self.public_key],
+        )
+
+        # Import ssm parameter
+        self.private_key_parameter = (
+            ssm.StringParameter.from_secure_string_parameter_attributes(
+                self,
+                "AudioSigningPrivateKeySecureParameter",
+                parameter_name=config.audio_signing_private_key_ssm_parameter,
+            )
+        )
@@ -1,17 +1,20 @@
 """Construct for WordsBackendLambdaFunctions."""
 
 from dataclasses import dataclass
+from typing import Optional
 from aws_cdk import (
     Duration,
     Stack,
     aws_lambda as _lambda,
     aws_iam as iam,
     aws_dynamodb as ddb,
+    aws_s3 as s3,
     aws_stepfunctions as sfn,
     aws_ssm as ssm,
 )
 from constructs import Construct
 from config import BaseConfig
+from spelling_game_backend.constructs.audio_signing_keys import AudioSigningKeys
 
 
 @dataclass
@@ -19,7 +22,11 @@ class BackendApiLambdaFunctionsParams:
     """Parameters for the BackendApiLambdaFunctions."""
 
     dynamodb_table: ddb.Table
+    sampling_index_name: str
+    s3_bucket: s3.Bucket
     state_machine: sfn.StateMachine
+    common_layer: _lambda.LayerVersion
+    audio_signing_keys: Optional[AudioSigningKeys] = None
 
 
 class BackendApiLambdaFunctions(Construct):
@@ -55,12 +62,39 @@ class BackendApiLambdaFunctions(Construct):
             code=_lambda.Code.from_asset(
                 "spelling_game_backend/lambda/generate_questions"
             ),
-            timeout=Duration.seconds(2),
+            layers=[params.common_layer],
+            timeout=Duration.seconds(5),
             environment={
+                "QUESTIONS_MODE": config.questions_mode,
                 "STATE_MACHINE_ARN": params.state_machine.state_machine_arn,
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+                "SAMPLING_INDEX_NAME": params.sampling_index_name,
+                "BUCKET_NAME": params.s3_bucket.bucket_name,
+                "AUDIO_DELIVERY": config.audio_delivery,
             },
         )
 
+        # Signed cookies for the word audio served through CloudFront
+        if params.audio_signing_keys:
+            self.generate_questions_lambda.add_environment(
+                "AUDIO_KEY_PAIR_ID", params.audio_signing_keys.public_key.public_key_id
+            )
+            self.generate_questions_lambda.add_environment(
+                "AUDIO_PRIVATE_KEY_SSM_PARAMETER",
+                params.audio_signing_keys.private_key_parameter.parameter_name,
+            )
+            self.generate_questions_lambda.add_environment(
+                "AUDIO_COOKIE_LIFETIME_SECONDS", "3600"
+            )
+            self.generate_questions_lambda.add_to_role_policy(
+                iam.PolicyStatement(
+                    actions=["ssm:GetParameter"],
+                    resources=[
+                        params.audio_signing_keys.private_key_parameter.parameter_arn
+                    ],
+                )
+            )
+
         self.generate_questions_lambda.add_to_role_policy(
             iam.PolicyStatement(
                 effect=iam.Effect.ALLOW,
@@ -69,6 +103,44 @@ class BackendApiLambdaFunctions(Construct):
             )
         )
 
+        # Words without a slot yet are queried from the table itself
+        self.generate_questions_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:Query"],
+                resources=[
+                    params.dynamodb_table.table_arn,
+                    f"{params.dynamodb_table.table_arn}/index/{params.sampling_index_name}",
+                ],
+            )
+        )
+
+        # Words pool slot count and precomputed question decks
+        self.generate_questions_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:GetItem", "dynamodb:BatchGetItem"],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        self.generate_questions_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["s3:GetObject"],
+                resources=[params.s3_bucket.bucket_arn + "/*"],
+            )
+        )
+
+        # Audio bundles too large to return inline
+        self.generate_questions_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["s3:PutObject"],
+                resources=[params.s3_bucket.arn_for_objects("audio/bundles/*")],
+            )
+        )
+
         # Create validate answers Lambda function
         self.validate_answers_lambda = _lambda.Function(
             self,
@@ -78,6 +150,7 @@ class BackendApiLambdaFunctions(Construct):
             code=_lambda.Code.from_asset(
                 "spelling_game_backend/lambda/validate_answers"
             ),
+            layers=[params.common_layer],
             timeout=Duration.seconds(2),
             environment={
                 "DDB_TABLE_NAME": params.dynamodb_table.table_name,
@@ -106,6 +179,8 @@ class BackendApiLambdaFunctions(Construct):
                 "SSM_PARAMETER_NAME": self.apigw_custom_header_parameter.parameter_name,
                 "CUSTOM_HEADER_KEY": config.apigw_custom_header_name,
                 "APIGW_PATH_PATTERN": f"arn:aws:execute-api:{Stack.of(self).region}:{Stack.of(self).account}:*/prod/POST/",
+                "SECRET_CACHE_TTL_SECONDS": "60",
+                "PREVIOUS_VALUE_GRACE_SECONDS": "1800",
             },
         )
 
@@ -13,6 +13,9 @@ from aws_cdk import (
 )
 from constructs import Construct
 from config import BaseConfig
+from spelling_game_backend.languages import language_codes
+
+LANGUAGE_DESCRIPTION = f"Language of the request, one of {', '.join(language_codes())}"
 
 
 @dataclass
@@ -101,8 +104,32 @@ class WordsBackendApi(Construct):
                 properties={
                     "language": apigateway.JsonSchema(
                         type=apigateway.JsonSchemaType.STRING,
-                        description="Language of the request, either en-US or nl-NL",
-                        enum=["en-US", "nl-NL"],
+                        description=LANGUAGE_DESCRIPTION,
+                        enum=language_codes(),
+                    ),
+                    "count": apigateway.JsonSchema(
+                        type=apigateway.JsonSchemaType.INTEGER,
+                        description="Number of distinct questions, 5 by default",
+                        minimum=1,
+                        maximum=20,
+                    ),
+                    "rounds": apigateway.JsonSchema(
+                        type=apigateway.JsonSchemaType.INTEGER,
+                        description="Rounds of count distinct questions, 1 by default",
+                        minimum=1,
+                        maximum=5,
+                    ),
+                    "formats": apigateway.JsonSchema(
+                        type=apigateway.JsonSchemaType.ARRAY,
+                        description="Audio formats the client can play, the smallest is served",
+                        items=apigateway.JsonSchema(
+                            type=apigateway.JsonSchemaType.STRING,
+                            enum=["mp3", "ogg_vorbis"],
+                        ),
+                    ),
+                    "bundle": apigateway.JsonSchema(
+                        type=apigateway.JsonSchemaType.BOOLEAN,
+                        description="Also return the audio of all questions as one bundle",
                     ),
                 },
                 required=["language"],
@@ -163,8 +190,8 @@ class WordsBackendApi(Construct):
                 properties={
                     "language": apigateway.JsonSchema(
                         type=apigateway.JsonSchemaType.STRING,
-                        description="Language of the request, either en-US or nl-NL",
-                        enum=["en-US", "nl-NL"],
+                        description=LANGUAGE_DESCRIPTION,
+                        enum=language_codes(),
                     ),
                     "answers": apigateway.JsonSchema(
                         type=apigateway.JsonSchemaType.ARRAY,
@@ -10,6 +10,7 @@ from aws_cdk import (
     aws_dynamodb as ddb,
 )
 from constructs import Construct
+from config import BaseConfig
 
 
 @dataclass
@@ -18,6 +19,7 @@ class WordsBackendLambdaFunctionsParams:
 
     s3_bucket: s3.Bucket
     dynamodb_table: ddb.Table
+    common_layer: _lambda.LayerVersion
 
 
 class WordsBackendLambdaFunctions(Construct):
@@ -33,6 +35,8 @@ class WordsBackendLambdaFunctions(Construct):
         """Construct a new WordsBackendLambdaFunctions."""
         super().__init__(scope=scope, id=construct_id, **kwargs)
 
+        config = BaseConfig()
+
         self.presigned_url_lambda = _lambda.Function(
             self,
             "CreatePresignedURL",
@@ -41,7 +45,11 @@ class WordsBackendLambdaFunctions(Construct):
             code=_lambda.Code.from_asset(
                 "spelling_game_backend/lambda/create_presigned_url"
             ),
-            environment={"BUCKET_NAME": params.s3_bucket.bucket_name},
+            environment={
+                "BUCKET_NAME": params.s3_bucket.bucket_name,
+                "AUDIO_DELIVERY": config.audio_delivery,
+            },
+            layers=[params.common_layer],
             timeout=Duration.seconds(3),
         )
 
@@ -61,5 +69,6 @@ class WordsBackendLambdaFunctions(Construct):
             code=_lambda.Code.from_asset(
                 "spelling_game_backend/lambda/get_unique_results"
             ),
+            layers=[params.common_layer],
             timeout=Duration.seconds(2),
         )
@@ -22,6 +22,7 @@ class WordsBackendStateMachineParams:
     s3_bucket: s3.Bucket
     dynamodb_table: ddb.Table
     sns_topic: sns.Topic
+    sampling_index_name: str
     presigned_url_lambda: _lambda.Function
     get_unique_results_lambda: _lambda.Function
 
@@ -71,58 +72,114 @@ class WordsBackendStateMachine(Construct):
             result_selector={"error": True},
         )
 
-        ddb_scan = tasks.CallAwsService(
+        word_pk = {
+            "S": sfn.JsonPath.format(
+                "Word#{}",
+                sfn.JsonPath.string_at("$$.Execution.Input.language"),
+            )
+        }
+        sampled_item_selector = {
+            "itemcount": sfn.JsonPath.number_at("$.Count"),
+            "items": sfn.JsonPath.string_at("$.Items"),
+        }
+        sampling_index_resources = [
+            params.dynamodb_table.table_arn,
+            f"{params.dynamodb_table.table_arn}/index/{params.sampling_index_name}",
+        ]
+
+        # Words are numbered densely by slot, so the number of slots bounds
+        # the random ones drawn for the language
+        get_pool_size = tasks.CallAwsService(
             self,
-            "DynamoDBGetRandomItems",
+            "GetWordsPoolSize",
             service="dynamodb",
-            action="scan",
+            action="getItem",
             parameters={
                 "TableName": params.dynamodb_table.table_arn,
-                "Limit": 50,
-                "ExclusiveStartKey": {
+                "Key": {
                     "pk": {
                         "S": sfn.JsonPath.format(
-                            "Word#{}",
-                            sfn.JsonPath.string_at("$$.Execution.Input.language"),
-                        ),
-                    },
-                    "sk": {"S": sfn.JsonPath.string_at("States.UUID()")},
-                },
-                "FilterExpression": "pk = :pk",
-                "ExpressionAttributeValues": {
-                    ":pk": {
-                        "S": sfn.JsonPath.format(
-                            "Word#{}",
+                            "Stats#{}",
                             sfn.JsonPath.string_at("$$.Execution.Input.language"),
                         )
-                    }
+                    },
+                    "sk": {"S": "Pool"},
                 },
-                "ReturnConsumedCapacity": "TOTAL",
+                "ProjectionExpression": "slot_count",
             },
             result_selector={
-                "itemcount": sfn.JsonPath.number_at("States.ArrayLength($.Items)"),
-                "items": sfn.JsonPath.string_at("$.Items"),
+                "size": sfn.JsonPath.string_to_json(
+                    sfn.JsonPath.string_at("$.Item.slot_count.N")
+                ),
             },
+            result_path="$.pool",
             iam_resources=[params.dynamodb_table.table_arn],
-        ).add_catch(send_sns_notification)
+        ).add_catch(
+            tasks.SnsPublish(
+                self,
+                "PoolSizeFailedNotificationToSNS",
+                topic=params.sns_topic,
+                message=sfn.TaskInput.from_object(
+                    {
+                        "output": sfn.JsonPath.object_at("$"),
+                    }
+                ),
+                result_selector={"error": True},
+            )
+        )
 
-        generate_presigned_url_function_and_trasnform = tasks.LambdaInvoke(
+        # Query the sampling index for the word at a uniformly random slot, or
+        # the next one when the slot was left empty
+        ddb_sample = tasks.CallAwsService(
             self,
-            "GeneratePresignedURLLambdaAndTransform",
-            lambda_function=params.presigned_url_lambda,
-            payload=sfn.TaskInput.from_json_path_at("$"),
-            output_path="$.Payload",
-        )
+            "DynamoDBSampleRandomItem",
+            service="dynamodb",
+            action="query",
+            parameters={
+                "TableName": params.dynamodb_table.table_arn,
+                "IndexName": params.sampling_index_name,
+                "KeyConditionExpression": "pk = :pk AND slot >= :slot",
+                "ExpressionAttributeValues": {
+                    ":pk": word_pk,
+                    ":slot": {
+                        "N": sfn.JsonPath.format(
+                            "{}",
+                            sfn.JsonPath.math_random(
+                                0, sfn.JsonPath.number_at("$.poolSize")
+                            ),
+                        )
+                    },
+                },
+                "Limit": 1,
+                "ReturnConsumedCapacity": "TOTAL",
+            },
+            result_selector=sampled_item_selector,
+            iam_resources=sampling_index_resources,
+        ).add_catch(send_sns_notification)
 
-        choose_random_item = sfn.Pass(
+        # Wrap around to the first word when the slots past the random one are empty
+        ddb_sample_first = tasks.CallAwsService(
             self,
-            "ChooseRandomItem",
+            "DynamoDBSampleFirstItem",
+            service="dynamodb",
+            action="query",
             parameters={
-                "item": sfn.JsonPath.object_at(
-                    "States.ArrayGetItem($.items,States.MathRandom(0, States.ArrayLength($.items)))"
-                ),
+                "TableName": params.dynamodb_table.table_arn,
+                "IndexName": params.sampling_index_name,
+                "KeyConditionExpression": "pk = :pk",
+                "ExpressionAttributeValues": {":pk": word_pk},
+                "Limit": 1,
+                "ReturnConsumedCapacity": "TOTAL",
             },
-        ).next(generate_presigned_url_function_and_trasnform)
+            result_selector=sampled_item_selector,
+            iam_resources=sampling_index_resources,
+        ).add_catch(send_sns_notification)
+
+        choose_sampled_item = sfn.Pass(
+            self,
+            "ChooseSampledItem",
+            input_path="$.items[0]",
+        )
 
         check_item_count = (
             sfn.Choice(
@@ -131,18 +188,50 @@ class WordsBackendStateMachine(Construct):
             )
             .when(
                 sfn.Condition.number_greater_than("$.itemcount", 0),
-                choose_random_item,
+                choose_sampled_item,
+            )
+            .otherwise(ddb_sample_first)
+        )
+
+        check_first_item_count = (
+            sfn.Choice(
+                self,
+                "CheckFirstItemCount",
+            )
+            .when(
+                sfn.Condition.number_greater_than("$.itemcount", 0),
+                choose_sampled_item,
             )
             .otherwise(send_sns_notification)
         )
 
-        ddb_scan.next(check_item_count)
+        ddb_sample.next(check_item_count)
+        ddb_sample_first.next(check_first_item_count)
 
         get_uniq_results_lambda = tasks.LambdaInvoke(
             self,
             "GetUniqueResultsLambda",
             lambda_function=params.get_unique_results_lambda,
-            payload=sfn.TaskInput.from_json_path_at("$"),
+            payload=sfn.TaskInput.from_object(
+                {
+                    "items": sfn.JsonPath.object_at("$"),
+                    "count": sfn.JsonPath.number_at("$$.Execution.Input.count"),
+                }
+            ),
+            output_path="$.Payload",
+        )
+
+        # Presign the whole question set in one invocation
+        generate_presigned_urls_function_and_trasnform = tasks.LambdaInvoke(
+            self,
+            "GeneratePresignedURLsLambdaAndTransform",
+            lambda_function=params.presigned_url_lambda,
+            payload=sfn.TaskInput.from_object(
+                {
+                    "items": sfn.JsonPath.object_at("$"),
+                    "formats": sfn.JsonPath.list_at("$$.Execution.Input.formats"),
+                }
+            ),
             output_path="$.Payload",
         )
 
@@ -151,9 +240,15 @@ class WordsBackendStateMachine(Construct):
                 self,
                 "FetchQuestionsMap",
                 items_path="$.iterate",
+                item_selector={
+                    "poolSize": sfn.JsonPath.number_at("$.pool.size"),
+                },
             )
-            .item_processor(ddb_scan)
+            .item_processor(ddb_sample)
+            .next(generate_presigned_urls_function_and_trasnform)
             .next(get_uniq_results_lambda)
         )
 
-        return sfn.DefinitionBody.from_chainable(fetch_questions_map)
+        return sfn.DefinitionBody.from_chainable(
+            get_pool_size.next(fetch_questions_map)
+        )
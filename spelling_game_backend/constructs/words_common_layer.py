@@ -0,0 +1,37 @@
+"""Construct for WordsCommonLayer."""
+
+from aws_cdk import (
+    BundlingOptions,
+    Stack,
+    aws_lambda as _lambda,
+)
+from constructs import Construct
+
+
+class WordsCommonLayer(Construct):
+    """Lambda layer with the code shared by the words Lambda functions."""
+
+    def __init__(self, scope: Stack, construct_id: str, **kwargs) -> None:
+        """Construct a new WordsCommonLayer."""
+        super().__init__(scope=scope, id=construct_id, **kwargs)
+
+        self.words_common_layer = _lambda.LayerVersion(
+            self,
+            "WordsCommonLayer",
+            # Third-party packages of the layer are installed from its
+            # requirements.txt next to the shared code
+            code=_lambda.Code.from_asset(
+                "spelling_game_backend/lambda_layers/words_common",
+                bundling=BundlingOptions(
+                    image=_lambda.Runtime.PYTHON_3_12.bundling_image,
+                    command=[
+                        "bash",
+                        "-c",
+                        "pip install -r requirements.txt -t /asset-output/python"
+                        " && cp -r python/. /asset-output/python",
+                    ],
+                ),
+            ),
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_12],
+            description="Code shared by the words Lambda functions.",
+        )
@@ -0,0 +1,121 @@
+"""Construct for WordsDecksMaterializer."""
+
+from dataclasses import dataclass
+from aws_cdk import (
+    Duration,
+    Stack,
+    aws_lambda as _lambda,
+    aws_iam as iam,
+    aws_dynamodb as ddb,
+    aws_events as events,
+    aws_events_targets as events_targets,
+    aws_stepfunctions as sfn,
+)
+from constructs import Construct
+from spelling_game_backend.languages import language_codes
+
+# Decks are otherwise only rebuilt when a pool needs words and a generation
+# run succeeds, so the same decks would be served for good
+DECKS_REFRESH_INTERVAL = Duration.minutes(15)
+
+
+@dataclass
+class WordsDecksMaterializerParams:
+    """Parameters for the WordsDecksMaterializer."""
+
+    dynamodb_table: ddb.Table
+    sampling_index_name: str
+    common_layer: _lambda.LayerVersion
+    words_generator_state_machine: sfn.StateMachine
+    rate_limit_table: ddb.Table
+    write_capacity: int
+
+
+class WordsDecksMaterializer(Construct):
+    """Rebuilds the precomputed question decks on a schedule and after generation."""
+
+    def __init__(
+        self,
+        scope: Stack,
+        construct_id: str,
+        params=WordsDecksMaterializerParams,
+        **kwargs,
+    ) -> None:
+        """Construct a new WordsDecksMaterializer."""
+        super().__init__(scope=scope, id=construct_id, **kwargs)
+
+        self.materialize_decks_lambda = _lambda.Function(
+            self,
+            "MaterializeDecks",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset(
+                "spelling_game_backend/lambda/materialize_decks"
+            ),
+            layers=[params.common_layer],
+            timeout=Duration.minutes(5),
+            environment={
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+                "SAMPLING_INDEX_NAME": params.sampling_index_name,
+                "RATE_LIMIT_TABLE_NAME": params.rate_limit_table.table_name,
+                "WRITES_PER_SECOND": str(params.write_capacity),
+            },
+        )
+
+        self.materialize_decks_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:Query"],
+                resources=[
+                    f"{params.dynamodb_table.table_arn}/index/{params.sampling_index_name}"
+                ],
+            )
+        )
+
+        self.materialize_decks_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:GetItem", "dynamodb:PutItem"],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        # Shared write rate limit bucket
+        self.materialize_decks_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:GetItem", "dynamodb:UpdateItem"],
+                resources=[params.rate_limit_table.table_arn],
+            )
+        )
+
+        # Refill the decks of a language whenever a generation run succeeds
+        events.Rule(
+            self,
+            "WordsGeneratedRule",
+            event_pattern=events.EventPattern(
+                source=["aws.states"],
+                detail_type=["Step Functions Execution Status Change"],
+                detail={
+                    "status": ["SUCCEEDED"],
+                    "stateMachineArn": [
+                        params.words_generator_state_machine.state_machine_arn
+                    ],
+                },
+            ),
+            targets=[events_targets.LambdaFunction(self.materialize_decks_lambda)],
+        )
+
+        events.Rule(
+            self,
+            "RefreshDecksRule",
+            schedule=events.Schedule.rate(DECKS_REFRESH_INTERVAL),
+            targets=[
+                events_targets.LambdaFunction(
+                    self.materialize_decks_lambda,
+                    event=events.RuleTargetInput.from_object(
+                        {"languages": language_codes()}
+                    ),
+                )
+            ],
+        )
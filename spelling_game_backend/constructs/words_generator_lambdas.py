@@ -0,0 +1,195 @@
+"""Construct for WordsGeneratorLambdaFunctions."""
+
+from dataclasses import dataclass
+from aws_cdk import (
+    Duration,
+    Stack,
+    aws_lambda as _lambda,
+    aws_iam as iam,
+    aws_dynamodb as ddb,
+    aws_s3 as s3,
+    aws_sns as sns,
+    aws_sns_subscriptions as subscriptions,
+)
+from constructs import Construct
+from config import BaseConfig
+
+
+@dataclass
+class WordsGeneratorLambdaFunctionsParams:
+    """Parameters for the WordsGeneratorLambdaFunctions."""
+
+    s3_bucket: s3.Bucket
+    dynamodb_table: ddb.Table
+    rate_limit_table: ddb.Table
+    common_layer: _lambda.LayerVersion
+    write_capacity: int
+
+
+class WordsGeneratorLambdaFunctions(Construct):
+    """Lambda functions for words generation."""
+
+    def __init__(
+        self,
+        scope: Stack,
+        construct_id: str,
+        params=WordsGeneratorLambdaFunctionsParams,
+        **kwargs,
+    ) -> None:
+        """Construct a new WordsGeneratorLambdaFunctions."""
+        super().__init__(scope=scope, id=construct_id, **kwargs)
+
+        config = BaseConfig()
+
+        # Polly publishes the speech synthesis task completions to this topic
+        self.synthesis_task_sns_topic = sns.Topic(
+            self,
+            "SynthesisTaskNotificationSNS",
+            display_name="SynthesisTaskNotificationSNS",
+        )
+
+        self.synthesis_task_callback_lambda = _lambda.Function(
+            self,
+            "SynthesisTaskCallback",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset(
+                "spelling_game_backend/lambda/synthesis_task_callback"
+            ),
+            timeout=Duration.seconds(10),
+            environment={
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+            },
+        )
+
+        self.synthesis_task_callback_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:PutItem", "dynamodb:DeleteItem"],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        self.synthesis_task_callback_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["polly:GetSpeechSynthesisTask"],
+                resources=["*"],
+            )
+        )
+
+        # The state machine ARN can't be referenced here without a circular
+        # dependency, task tokens are unguessable
+        self.synthesis_task_callback_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["states:SendTaskSuccess", "states:SendTaskFailure"],
+                resources=["*"],
+            )
+        )
+
+        self.synthesis_task_sns_topic.add_subscription(
+            subscriptions.LambdaSubscription(self.synthesis_task_callback_lambda)
+        )
+
+        # Synchronous speech synthesis for a whole batch of words
+        self.synthesize_words_lambda = _lambda.Function(
+            self,
+            "SynthesizeWords",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset(
+                "spelling_game_backend/lambda/synthesize_words"
+            ),
+            layers=[params.common_layer],
+            timeout=Duration.minutes(3),
+            memory_size=256,
+            environment={
+                "BUCKET_NAME": params.s3_bucket.bucket_name,
+                "RATE_LIMIT_TABLE_NAME": params.rate_limit_table.table_name,
+                "MAX_CONCURRENCY": "4",
+                "POLLY_REQUESTS_PER_SECOND": str(config.polly_requests_per_second),
+            },
+        )
+
+        # Shared Polly rate limit bucket
+        self.synthesize_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:GetItem", "dynamodb:UpdateItem"],
+                resources=[params.rate_limit_table.table_arn],
+            )
+        )
+
+        self.synthesize_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["polly:SynthesizeSpeech"],
+                resources=["*"],
+            )
+        )
+
+        self.synthesize_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["s3:PutObject"],
+                resources=[params.s3_bucket.bucket_arn + "/*"],
+            )
+        )
+
+        # Drops generated words that are already saved before any paid call
+        self.prepare_generated_words_lambda = _lambda.Function(
+            self,
+            "PrepareGeneratedWords",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset(
+                "spelling_game_backend/lambda/prepare_generated_words"
+            ),
+            layers=[params.common_layer],
+            timeout=Duration.seconds(10),
+            environment={
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+            },
+        )
+
+        self.prepare_generated_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:BatchGetItem"],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        # Saves the synthesized words of a run in batches
+        self.persist_words_lambda = _lambda.Function(
+            self,
+            "PersistWords",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset("spelling_game_backend/lambda/persist_words"),
+            layers=[params.common_layer],
+            timeout=Duration.minutes(5),
+            environment={
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+                "RATE_LIMIT_TABLE_NAME": params.rate_limit_table.table_name,
+                "WRITES_PER_SECOND": str(params.write_capacity),
+            },
+        )
+
+        self.persist_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:BatchWriteItem", "dynamodb:UpdateItem"],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        # Shared write rate limit bucket
+        self.persist_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:GetItem", "dynamodb:UpdateItem"],
+                resources=[params.rate_limit_table.table_arn],
+            )
+        )
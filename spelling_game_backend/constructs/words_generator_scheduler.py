@@ -4,13 +4,17 @@ import json
 
 from dataclasses import dataclass
 from aws_cdk import (
+    Duration,
     Stack,
     aws_scheduler as scheduler,
     aws_iam as iam,
+    aws_lambda as _lambda,
+    aws_dynamodb as ddb,
     aws_stepfunctions as sfn,
 )
 from constructs import Construct
 from config import BaseConfig
+from spelling_game_backend.languages import LANGUAGES
 
 
 @dataclass
@@ -18,6 +22,8 @@ class WordsGeneratorSchedulerParams:
     """Parameters for the WordsGeneratorScheduler."""
 
     state_machine: sfn.StateMachine
+    dynamodb_table: ddb.Table
+    common_layer: _lambda.LayerVersion
 
 
 class WordsGeneratorScheduler(Construct):
@@ -38,57 +44,81 @@ class WordsGeneratorScheduler(Construct):
         interval = config.words_generation_interval
         max_window = int(interval / 2)
 
-        # NL words generator state machine
+        # Starts the words generator state machine only when a pool needs words
+        self.check_words_pool_lambda = _lambda.Function(
+            self,
+            "CheckWordsPool",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset(
+                "spelling_game_backend/lambda/check_words_pool"
+            ),
+            layers=[params.common_layer],
+            timeout=Duration.seconds(30),
+            environment={
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+                "STATE_MACHINE_ARN": params.state_machine.state_machine_arn,
+                "LOW_WATERMARK": str(config.words_pool_low_watermark),
+                "HIGH_WATERMARK": str(config.words_pool_high_watermark),
+                "FRESHNESS_HOURS": str(config.words_pool_freshness_hours),
+            },
+        )
+
+        self.check_words_pool_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=[
+                    "dynamodb:GetItem",
+                    "dynamodb:Query",
+                    "dynamodb:UpdateItem",
+                ],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        self.check_words_pool_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["cloudwatch:GetMetricStatistics"],
+                resources=["*"],
+            )
+        )
+
+        self.check_words_pool_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["states:StartExecution"],
+                resources=[params.state_machine.state_machine_arn],
+            )
+        )
+
         scheduler_role = iam.Role(
             self,
             "WordsGenerateSchedulerRole",
             assumed_by=iam.ServicePrincipal("scheduler.amazonaws.com"),
             inline_policies={
-                "StepFunctionExecutionPolicy": iam.PolicyDocument(
+                "CheckWordsPoolInvokePolicy": iam.PolicyDocument(
                     statements=[
                         iam.PolicyStatement(
-                            actions=["states:StartExecution"],
+                            actions=["lambda:InvokeFunction"],
                             effect=iam.Effect.ALLOW,
-                            resources=[params.state_machine.state_machine_arn],
+                            resources=[self.check_words_pool_lambda.function_arn],
                         )
                     ]
                 )
             },
         )
 
-        self.scheduler_nl = scheduler.CfnSchedule(
-            self,
-            "WordsGeneratorSchedulerNL",
-            schedule_expression=f"cron(*/{interval} * * * ? *)",
-            target=scheduler.CfnSchedule.TargetProperty(
-                arn=params.state_machine.state_machine_arn,
-                role_arn=scheduler_role.role_arn,
-                input=json.dumps(
-                    {
-                        "language": "nl-NL",
-                        "languageName": "Dutch",
-                    }
-                ),
-            ),
-            flexible_time_window=scheduler.CfnSchedule.FlexibleTimeWindowProperty(
-                mode="FLEXIBLE",
-                maximum_window_in_minutes=max_window,
-            ),
-            state="ENABLED",
-        )
-
-        self.scheduler_en = scheduler.CfnSchedule(
+        # One schedule checks the pools of all registered languages
+        self.scheduler = scheduler.CfnSchedule(
             self,
-            "WordsGeneratorSchedulerEN",
+            "WordsGeneratorScheduler",
             schedule_expression=f"cron(*/{interval} * * * ? *)",
             target=scheduler.CfnSchedule.TargetProperty(
-                arn=params.state_machine.state_machine_arn,
+                arn=self.check_words_pool_lambda.function_arn,
                 role_arn=scheduler_role.role_arn,
                 input=json.dumps(
-                    {
-                        "language": "en-US",
-                        "languageName": "English",
-                    }
+                    {"languages": [language.to_input() for language in LANGUAGES]}
                 ),
             ),
             flexible_time_window=scheduler.CfnSchedule.FlexibleTimeWindowProperty(
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from aws_cdk import (
     Duration,
     Stack,
+    Token,
     aws_s3 as s3,
     aws_sns as sns,
     aws_stepfunctions as sfn,
@@ -11,8 +12,17 @@ from aws_cdk import (
     aws_bedrock as bedrock,
     aws_iam as iam,
     aws_dynamodb as ddb,
+    aws_lambda as _lambda,
 )
 from constructs import Construct
+from config import BaseConfig
+from spelling_game_backend.languages import MAX_PARALLEL_LANGUAGES
+from spelling_game_backend.lambda_layers.words_common.python.words_common.audio import (
+    AUDIO_CACHE_CONTROL,
+)
+
+# Output tokens allowed per generated word and its description
+MAX_TOKENS_PER_WORD = 40
 
 
 @dataclass
@@ -22,6 +32,11 @@ class WordsGeneratorStateMachineParams:
     s3_bucket: s3.Bucket
     dynamodb_table: ddb.Table
     sns_topic: sns.Topic
+    synthesis_task_sns_topic: sns.Topic
+    synthesis_task_callback_lambda: _lambda.Function
+    synthesize_words_lambda: _lambda.Function
+    prepare_generated_words_lambda: _lambda.Function
+    persist_words_lambda: _lambda.Function
 
 
 class WordsGeneratorStateMachine(Construct):
@@ -42,7 +57,10 @@ class WordsGeneratorStateMachine(Construct):
             "BedrockModelAnthropicClaude35Haiku",
             bedrock.FoundationModelIdentifier.ANTHROPIC_CLAUDE_3_HAIKU_20240307_V1_0,
         )
-        prompt = "Generate 5 unique words that has random number of characters more than 4 and less than 10 in {} language. For each word, provide a brief description of its meaning in English with more than a couple of words. Produce output only in minified JSON array with the keys word and description. Word always must be in lowercase."
+        config = BaseConfig()
+        batch_size = config.words_generation_batch_size
+
+        prompt = f"Generate {batch_size} unique words that has random number of characters more than 4 and less than 10 in {{}} language. For each word, provide a brief description of its meaning in English with more than a couple of words. Produce output only in minified JSON array with the keys word and description. Word always must be in lowercase."
         call_bedrock_task = tasks.BedrockInvokeModel(
             self,
             "GenerateWords",
@@ -50,7 +68,7 @@ class WordsGeneratorStateMachine(Construct):
             body=sfn.TaskInput.from_object(
                 {
                     "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": 300,
+                    "max_tokens": batch_size * MAX_TOKENS_PER_WORD,
                     "messages": [
                         {
                             "role": "user",
@@ -66,22 +84,29 @@ class WordsGeneratorStateMachine(Construct):
                     ],
                 }
             ),
+            # Parsed by PrepareGeneratedWords, so a truncated or malformed
+            # tail only loses the last words
             result_selector={
-                "words": sfn.JsonPath.string_to_json(
-                    sfn.JsonPath.string_at("$.Body.content[0].text")
-                )
+                "text": sfn.JsonPath.string_at("$.Body.content[0].text"),
             },
+            result_path="$.generated",
         )
 
+        # Asynchronous synthesis fallback, one task per word left unsynthesized
         langages_map = sfn.Map(
             self,
             "LanguagesMap",
-            items_path="$.words",
+            items_path="$.pending.words",
+            max_concurrency_path="$.synthesisConcurrency",
             item_selector={
-                "language": sfn.JsonPath.string_at("$$.Execution.Input.language"),
+                "language": sfn.JsonPath.string_at("$.language"),
+                "voiceId": sfn.JsonPath.string_at("$.voiceId"),
+                "engine": sfn.JsonPath.string_at("$.engine"),
+                "outputPrefix": sfn.JsonPath.string_at("$.outputPrefix"),
                 "word": sfn.JsonPath.string_at("$$.Map.Item.Value.word"),
                 "description": sfn.JsonPath.string_at("$$.Map.Item.Value.description"),
             },
+            result_path="$.fallback",
         )
 
         synthesis_task_status_choice = sfn.Choice(
@@ -89,50 +114,108 @@ class WordsGeneratorStateMachine(Construct):
             "SynthesisTaskStatusChoice",
         )
 
-        failed_sns_notification = tasks.SnsPublish(
-            self,
-            "FailedNotificationToSNS",
-            topic=params.sns_topic,
-            message=sfn.TaskInput.from_object(
-                {
-                    "output": sfn.JsonPath.object_at("$.output"),
-                }
-            ),
+        failed_sns_notification = self._failed_sns_notification(
+            "FailedNotificationToSNS", params, "$.output"
         )
 
-        save_word_to_dynamodb = tasks.DynamoPutItem(
+        # Normalize the synthesis task output to the synthesized word record
+        format_synthesized_word = sfn.Pass(
             self,
-            "SaveWordToDynamoDB",
-            table=params.dynamodb_table,
-            item={
-                "pk": tasks.DynamoAttributeValue.from_string(
-                    sfn.JsonPath.format("Word#{}", sfn.JsonPath.string_at("$.language"))
-                ),
-                "sk": tasks.DynamoAttributeValue.from_string(
-                    sfn.JsonPath.string_at("States.Hash($.word, 'MD5')")
-                ),
-                "word": tasks.DynamoAttributeValue.from_string(
-                    sfn.JsonPath.string_at("$.word")
+            "FormatSynthesizedWord",
+            parameters={
+                "language": sfn.JsonPath.string_at("$.language"),
+                "word": sfn.JsonPath.string_at("$.word"),
+                "description": sfn.JsonPath.string_at("$.description"),
+                "s3file": sfn.JsonPath.format(
+                    "s3://{}/{}",
+                    params.s3_bucket.bucket_name,
+                    sfn.JsonPath.string_at("$.audio.key"),
                 ),
-                "description": tasks.DynamoAttributeValue.from_string(
-                    sfn.JsonPath.string_at("$.description")
+                "charcount": sfn.JsonPath.number_at(
+                    "$.output.SynthesisTask.RequestCharacters"
                 ),
-                "s3file": tasks.DynamoAttributeValue.from_string(
-                    sfn.JsonPath.string_at("$.output.SynthesisTask.OutputUri")
+            },
+        )
+
+        # Move the task output to the word's content-addressed key, same as
+        # words_common.audio.audio_key
+        task_output_uri_parts = sfn.JsonPath.string_split(
+            sfn.JsonPath.string_at("$.output.SynthesisTask.OutputUri"), "/"
+        )
+        audio_key = sfn.Pass(
+            self,
+            "AudioKey",
+            parameters={
+                "key": sfn.JsonPath.format(
+                    "audio/{}/{}.mp3",
+                    sfn.JsonPath.string_at("$.language"),
+                    sfn.JsonPath.hash(sfn.JsonPath.string_at("$.word"), "MD5"),
                 ),
-                "charcount": tasks.DynamoAttributeValue.number_from_string(
-                    sfn.JsonPath.format(
-                        "{}",
-                        sfn.JsonPath.string_at(
-                            "$.output.SynthesisTask.RequestCharacters"
+                # Polly may insert a "." between the prefix and the task id,
+                # so the file name is taken from the task output URI
+                "taskOutputKey": sfn.JsonPath.format(
+                    "{}{}",
+                    sfn.JsonPath.string_at("$.outputPrefix"),
+                    sfn.JsonPath.array_get_item(
+                        task_output_uri_parts,
+                        Token.as_number(
+                            sfn.JsonPath.math_add(
+                                Token.as_number(
+                                    sfn.JsonPath.array_length(task_output_uri_parts)
+                                ),
+                                -1,
+                            )
                         ),
-                    )
+                    ),
                 ),
-                "updated_at": tasks.DynamoAttributeValue.from_string(
-                    sfn.JsonPath.string_at("$$.State.EnteredTime")
+            },
+            result_path="$.audio",
+        )
+
+        copy_synthesized_audio = tasks.CallAwsService(
+            self,
+            "CopySynthesizedAudio",
+            service="s3",
+            action="copyObject",
+            parameters={
+                "Bucket": params.s3_bucket.bucket_name,
+                "Key": sfn.JsonPath.string_at("$.audio.key"),
+                "CopySource": sfn.JsonPath.format(
+                    "{}/{}",
+                    params.s3_bucket.bucket_name,
+                    sfn.JsonPath.string_at("$.audio.taskOutputKey"),
                 ),
+                "CacheControl": AUDIO_CACHE_CONTROL,
+                "ContentType": "audio/mpeg",
+                "MetadataDirective": "REPLACE",
             },
-        ).add_catch(failed_sns_notification)
+            iam_action="s3:PutObject",
+            iam_resources=[params.s3_bucket.arn_for_objects("*")],
+            additional_iam_statements=[
+                iam.PolicyStatement(
+                    actions=["s3:GetObject"],
+                    resources=[params.s3_bucket.arn_for_objects("*")],
+                )
+            ],
+            result_path=sfn.JsonPath.DISCARD,
+        )
+
+        delete_synthesis_task_output = tasks.CallAwsService(
+            self,
+            "DeleteSynthesisTaskOutput",
+            service="s3",
+            action="deleteObject",
+            parameters={
+                "Bucket": params.s3_bucket.bucket_name,
+                "Key": sfn.JsonPath.string_at("$.audio.taskOutputKey"),
+            },
+            iam_resources=[params.s3_bucket.arn_for_objects("*")],
+            result_path=sfn.JsonPath.DISCARD,
+        )
+
+        audio_key.next(copy_synthesized_audio).next(delete_synthesis_task_output).next(
+            format_synthesized_word
+        )
 
         get_speech_synthesis_task = tasks.CallAwsService(
             self,
@@ -144,13 +227,48 @@ class WordsGeneratorStateMachine(Construct):
             },
             iam_resources=["*"],
             result_path="$.output",
-        ).next(synthesis_task_status_choice)
+        )
+        get_speech_synthesis_task.add_retry(
+            errors=["Polly.ThrottlingException"],
+            interval=Duration.seconds(1),
+            backoff_rate=2,
+            max_attempts=5,
+            jitter_strategy=sfn.JitterType.FULL,
+        )
+        get_speech_synthesis_task.next(synthesis_task_status_choice)
+
+        # Resumed by the Polly task notification as soon as the audio is saved,
+        # polling the task status remains only as a fallback on timeout
+        wait_for_synthesis_task = tasks.LambdaInvoke(
+            self,
+            "WaitForSynthesisTaskCompletion",
+            lambda_function=params.synthesis_task_callback_lambda,
+            integration_pattern=sfn.IntegrationPattern.WAIT_FOR_TASK_TOKEN,
+            payload=sfn.TaskInput.from_object(
+                {
+                    "taskToken": sfn.JsonPath.task_token,
+                    "taskId": sfn.JsonPath.string_at("$.output.SynthesisTask.TaskId"),
+                }
+            ),
+            task_timeout=sfn.Timeout.duration(Duration.seconds(60)),
+            result_path="$.output",
+        )
+        wait_for_synthesis_task.add_catch(
+            get_speech_synthesis_task,
+            errors=[sfn.Errors.TIMEOUT],
+            result_path="$.error",
+        )
+        wait_for_synthesis_task.add_catch(
+            failed_sns_notification,
+            result_path="$.error",
+        )
+        wait_for_synthesis_task.next(audio_key)
 
         synthesis_task_status_choice.when(
             sfn.Condition.string_equals(
                 "$.output.SynthesisTask.TaskStatus", "completed"
             ),
-            save_word_to_dynamodb,
+            audio_key,
         ).when(
             sfn.Condition.string_equals("$.output.SynthesisTask.TaskStatus", "failed"),
             failed_sns_notification,
@@ -162,63 +280,147 @@ class WordsGeneratorStateMachine(Construct):
             ).next(get_speech_synthesis_task)
         )
 
-        speech_synthesis_task_nl = tasks.CallAwsService(
+        speech_synthesis_task = tasks.CallAwsService(
             self,
-            "StartSpeechSynthesisTaskNL",
+            "StartSpeechSynthesisTask",
             service="polly",
             action="startSpeechSynthesisTask",
             parameters={
-                "Engine": "standard",
-                "LanguageCode": "nl-NL",
+                "Engine": sfn.JsonPath.string_at("$.engine"),
+                "LanguageCode": sfn.JsonPath.string_at("$.language"),
                 "OutputFormat": "mp3",
                 "OutputS3BucketName": params.s3_bucket.bucket_name,
-                "OutputS3KeyPrefix": "nl-NL/",
+                "OutputS3KeyPrefix": sfn.JsonPath.string_at("$.outputPrefix"),
                 "Text": sfn.JsonPath.string_at("$.word"),
-                "VoiceId": "Ruben",
+                "SnsTopicArn": params.synthesis_task_sns_topic.topic_arn,
+                "VoiceId": sfn.JsonPath.string_at("$.voiceId"),
             },
             iam_resources=["*"],
             result_path="$.output",
-        ).next(get_speech_synthesis_task)
+        )
+        # Bursts of the fallback path are bounded by the map concurrency,
+        # throttled calls are retried instead of failing the word
+        speech_synthesis_task.add_retry(
+            errors=["Polly.ThrottlingException"],
+            interval=Duration.seconds(1),
+            backoff_rate=2,
+            max_attempts=5,
+            jitter_strategy=sfn.JitterType.FULL,
+        )
+        speech_synthesis_task.next(wait_for_synthesis_task)
+
+        langages_map.item_processor(speech_synthesis_task)
 
-        speech_synthesis_task_en = tasks.CallAwsService(
+        # Synthesize the whole batch in one step, falling back to one
+        # asynchronous synthesis task per word if the worker fails
+        synthesize_words = tasks.LambdaInvoke(
             self,
-            "StartSpeechSynthesisTaskEN",
-            service="polly",
-            action="startSpeechSynthesisTask",
-            parameters={
-                "Engine": "standard",
-                "LanguageCode": "en-US",
-                "OutputFormat": "mp3",
-                "OutputS3BucketName": params.s3_bucket.bucket_name,
-                "OutputS3KeyPrefix": "en-US/",
-                "Text": sfn.JsonPath.string_at("$.word"),
-                "VoiceId": "Matthew",
+            "SynthesizeWords",
+            lambda_function=params.synthesize_words_lambda,
+            payload=sfn.TaskInput.from_object(
+                {
+                    "language": {
+                        "language": sfn.JsonPath.string_at("$.language"),
+                        "voiceId": sfn.JsonPath.string_at("$.voiceId"),
+                        "engine": sfn.JsonPath.string_at("$.engine"),
+                        "synthesisConcurrency": sfn.JsonPath.number_at(
+                            "$.synthesisConcurrency"
+                        ),
+                    },
+                    "words": sfn.JsonPath.object_at("$.prepared.words"),
+                }
+            ),
+            result_selector={
+                "words": sfn.JsonPath.object_at("$.Payload.words"),
+                "failed": sfn.JsonPath.object_at("$.Payload.failed"),
             },
-            iam_resources=["*"],
-            result_path="$.output",
-        ).next(get_speech_synthesis_task)
+            result_path="$.synthesized",
+        )
+        synthesize_words.add_catch(
+            sfn.Pass(
+                self,
+                "AllWordsPending",
+                parameters={"words": sfn.JsonPath.object_at("$.prepared.words")},
+                result_path="$.pending",
+            ).next(langages_map),
+            result_path="$.error",
+        )
+
+        # Words of both synthesis paths are saved in batches
+        persist_words = self._persist_words(
+            "PersistWords", params, "$.synthesized.words", result_path="$.persisted"
+        )
+        langages_map.next(
+            self._persist_words("PersistSynthesizedWords", params, "$.fallback")
+        )
+
+        # Words the worker failed to synthesize go through the fallback too
+        failed_words_choice = (
+            sfn.Choice(
+                self,
+                "FailedWordsChoice",
+            )
+            .when(
+                sfn.Condition.is_present("$.synthesized.failed[0]"),
+                sfn.Pass(
+                    self,
+                    "FailedWordsPending",
+                    parameters={
+                        "words": sfn.JsonPath.object_at("$.synthesized.failed")
+                    },
+                    result_path="$.pending",
+                ).next(langages_map),
+            )
+            .otherwise(
+                sfn.Succeed(self, "AllWordsSynthesized", output_path="$.persisted")
+            )
+        )
+
+        prepare_generated_words = tasks.LambdaInvoke(
+            self,
+            "PrepareGeneratedWords",
+            lambda_function=params.prepare_generated_words_lambda,
+            payload=sfn.TaskInput.from_object(
+                {
+                    "language": sfn.JsonPath.string_at("$.language"),
+                    "text": sfn.JsonPath.string_at("$.generated.text"),
+                    "alphabet": sfn.JsonPath.string_at("$.alphabet"),
+                }
+            ),
+            result_selector={
+                "words": sfn.JsonPath.object_at("$.Payload.words"),
+            },
+            result_path="$.prepared",
+        )
 
-        language_choice = (
+        # Nothing to synthesize when every generated word is already saved
+        new_words_choice = (
             sfn.Choice(
                 self,
-                "LanguageChoice",
+                "NewWordsChoice",
             )
             .when(
-                sfn.Condition.string_equals("$.language", "nl-NL"),
-                speech_synthesis_task_nl,
+                sfn.Condition.is_present("$.prepared.words[0]"),
+                synthesize_words.next(persist_words).next(failed_words_choice),
             )
-            .otherwise(speech_synthesis_task_en)
+            .otherwise(sfn.Succeed(self, "NoNewWords"))
         )
 
-        langages_map.item_processor(language_choice)
+        # Words of every language in the input are generated in parallel
+        languages_fan_out = sfn.Map(
+            self,
+            "LanguagesFanOut",
+            items_path="$.languages",
+            max_concurrency=MAX_PARALLEL_LANGUAGES,
+        ).item_processor(
+            call_bedrock_task.next(prepare_generated_words).next(new_words_choice)
+        )
 
         self.word_generator_state_machine = sfn.StateMachine(
             self,
             "WordGeneratorStateMachine",
             state_machine_type=sfn.StateMachineType.STANDARD,
-            definition_body=sfn.DefinitionBody.from_chainable(
-                call_bedrock_task.next(langages_map)
-            ),
+            definition_body=sfn.DefinitionBody.from_chainable(languages_fan_out),
         )
 
         self.word_generator_state_machine.role.attach_inline_policy(
@@ -234,6 +436,10 @@ class WordsGeneratorStateMachine(Construct):
                             ],
                             resources=["*"],
                         ),
+                        iam.PolicyStatement(
+                            actions=["sns:Publish"],
+                            resources=[params.synthesis_task_sns_topic.topic_arn],
+                        ),
                         iam.PolicyStatement(
                             actions=["s3:PutObject"],
                             resources=[
@@ -245,3 +451,56 @@ class WordsGeneratorStateMachine(Construct):
                 ),
             )
         )
+
+    def _failed_sns_notification(
+        self, construct_id: str, params: WordsGeneratorStateMachineParams, path: str
+    ):
+        """Create a task that publishes the state at path to the failure topic."""
+
+        return tasks.SnsPublish(
+            self,
+            construct_id,
+            topic=params.sns_topic,
+            message=sfn.TaskInput.from_object(
+                {
+                    "output": sfn.JsonPath.object_at(path),
+                }
+            ),
+        )
+
+    def _persist_words(
+        self,
+        construct_id: str,
+        params: WordsGeneratorStateMachineParams,
+        path: str,
+        result_path: str = None,
+    ):
+        """Create a task that saves the synthesized word records at path.
+
+        The task output replaces the state, unless a result_path keeps it.
+        """
+
+        output = (
+            {
+                "result_selector": {"saved": sfn.JsonPath.number_at("$.Payload.saved")},
+                "result_path": result_path,
+            }
+            if result_path
+            else {"output_path": "$.Payload"}
+        )
+        return tasks.LambdaInvoke(
+            self,
+            construct_id,
+            lambda_function=params.persist_words_lambda,
+            payload=sfn.TaskInput.from_object(
+                {
+                    "language": sfn.JsonPath.string_at("$.language"),
+                    "words": sfn.JsonPath.object_at(path),
+                }
+            ),
+            **output,
+        ).add_catch(
+            self._failed_sns_notification(
+                f"{construct_id}FailedNotificationToSNS", params, "$"
+            )
+        )
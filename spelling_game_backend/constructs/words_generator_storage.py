@@ -1,6 +1,7 @@
 """Construct for WordsGeneratorStorage."""
 
 from aws_cdk import (
+    Duration,
     Stack,
     aws_dynamodb as dynamodb,
     aws_s3 as s3,
@@ -23,8 +24,19 @@ class WordsGeneratorStorage(Construct):
         self.words_storage_s3_bucket = s3.Bucket(
             self,
             "WordsStorageS3Bucket",
+            lifecycle_rules=[
+                # Audio bundles are only fetched by the game they were made for.
+                # Their Cache-Control max-age matches this expiration.
+                s3.LifecycleRule(
+                    prefix="audio/bundles/",
+                    expiration=Duration.days(1),
+                )
+            ],
         )
 
+        # Provisioned write capacity, also used to pace batch writes
+        self.words_storage_write_capacity = 2
+
         # dynamodb table to store the words
         self.words_storage_dynamodb_table = dynamodb.Table(
             self,
@@ -39,5 +51,42 @@ class WordsGeneratorStorage(Construct):
             ),
             billing_mode=dynamodb.BillingMode.PROVISIONED,
             read_capacity=5,
+            write_capacity=self.words_storage_write_capacity,
+            time_to_live_attribute="ttl",
+        )
+
+        # Sampling index: every word gets the next "slot" number of its
+        # language at ingest, so a query for a uniformly random slot returns
+        # a uniformly random word at a constant read cost regardless of the
+        # pool size.
+        self.words_sampling_index_name = "SamplingIndex"
+        self.words_storage_dynamodb_table.add_global_secondary_index(
+            index_name=self.words_sampling_index_name,
+            partition_key=dynamodb.Attribute(
+                name="pk",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            sort_key=dynamodb.Attribute(
+                name="slot",
+                type=dynamodb.AttributeType.NUMBER,
+            ),
+            projection_type=dynamodb.ProjectionType.ALL,
+            read_capacity=5,
             write_capacity=2,
         )
+
+        # Shared rate limit buckets. Kept apart from the words table, whose
+        # provisioned writes the buckets would otherwise use up.
+        self.rate_limit_dynamodb_table = dynamodb.Table(
+            self,
+            "RateLimitDynamoDBTable",
+            partition_key=dynamodb.Attribute(
+                name="pk",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            sort_key=dynamodb.Attribute(
+                name="sk",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+        )
@@ -0,0 +1,144 @@
+"""Construct for WordsStorageMigrations."""
+
+import json
+from dataclasses import dataclass
+from aws_cdk import (
+    Duration,
+    Stack,
+    aws_lambda as _lambda,
+    aws_iam as iam,
+    aws_dynamodb as ddb,
+    aws_s3 as s3,
+    custom_resources as cr,
+)
+from constructs import Construct
+from spelling_game_backend.languages import LANGUAGES
+
+# Bump this to run the backfill again on the next deployment
+MIGRATIONS_VERSION = "4"
+
+
+@dataclass
+class WordsStorageMigrationsParams:
+    """Parameters for the WordsStorageMigrations."""
+
+    dynamodb_table: ddb.Table
+    s3_bucket: s3.Bucket
+    common_layer: _lambda.LayerVersion
+
+
+class WordsStorageMigrations(Construct):
+    """Backfill of existing words for attributes and audio added after ingest."""
+
+    def __init__(
+        self,
+        scope: Stack,
+        construct_id: str,
+        params=WordsStorageMigrationsParams,
+        **kwargs,
+    ) -> None:
+        """Construct a new WordsStorageMigrations."""
+        super().__init__(scope=scope, id=construct_id, **kwargs)
+
+        self.backfill_words_lambda = _lambda.Function(
+            self,
+            "BackfillWords",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.lambda_handler",
+            code=_lambda.Code.from_asset("spelling_game_backend/lambda/backfill_words"),
+            layers=[params.common_layer],
+            timeout=Duration.minutes(15),
+            environment={
+                "DDB_TABLE_NAME": params.dynamodb_table.table_name,
+                "BUCKET_NAME": params.s3_bucket.bucket_name,
+                "WRITES_PER_SECOND": "1",
+                "COPIES_PER_SECOND": "10",
+                "VOICES": json.dumps(
+                    {
+                        language.code: {
+                            "VoiceId": language.voice_id,
+                            "Engine": language.engine,
+                        }
+                        for language in LANGUAGES
+                    }
+                ),
+            },
+        )
+
+        self.backfill_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["dynamodb:Scan", "dynamodb:UpdateItem"],
+                resources=[params.dynamodb_table.table_arn],
+            )
+        )
+
+        # Copy the audio of existing words to content-addressed keys
+        self.backfill_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["s3:GetObject", "s3:PutObject"],
+                resources=[params.s3_bucket.arn_for_objects("*")],
+            )
+        )
+
+        # Synthesize the audio formats added after words were saved
+        self.backfill_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["polly:SynthesizeSpeech"],
+                resources=["*"],
+            )
+        )
+
+        # Allow the backfill to continue itself in a new invocation. The
+        # function ARN can't be referenced here without a circular dependency.
+        self.backfill_words_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    f"arn:aws:lambda:{Stack.of(self).region}:{Stack.of(self).account}:function:*BackfillWords*"
+                ],
+            )
+        )
+
+        # IAM Role for custom resource
+        custom_resource_role = iam.Role(
+            scope=self,
+            id="CustomResourceRole",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+        )
+
+        custom_resource_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[self.backfill_words_lambda.function_arn],
+            )
+        )
+
+        # Custom resource to run the backfill on create and whenever the
+        # migrations version changes
+        invoke_backfill = cr.AwsSdkCall(
+            service="lambda",
+            action="Invoke",
+            physical_resource_id=cr.PhysicalResourceId.of(
+                f"BackfillWordsCustomResource-{MIGRATIONS_VERSION}"
+            ),
+            parameters={
+                "FunctionName": self.backfill_words_lambda.function_name,
+                "InvocationType": "Event",
+                "Payload": json.dumps({"MigrationsVersion": MIGRATIONS_VERSION}),
+            },
+        )
+
+        cr.AwsCustomResource(
+            self,
+            "BackfillWordsCustomResource",
+            on_create=invoke_backfill,
+            on_update=invoke_backfill,
+            policy=cr.AwsCustomResourcePolicy.from_sdk_calls(
+                resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE
+            ),
+            role=custom_resource_role,
+        )
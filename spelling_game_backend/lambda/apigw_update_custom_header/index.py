@@ -56,5 +56,7 @@ def update_parameter(secret):
 def lambda_handler(event, context):
     # Update the secure header value with random value
     secret = secrets.token_urlsafe(SECRET_LENGTH)
-    update_cloudfront_header(secret)
+    # Update the parameter first, so the authorizer already accepts the new
+    # value and still accepts the previous one while CloudFront deploys
     update_parameter(secret)
+    update_cloudfront_header(secret)
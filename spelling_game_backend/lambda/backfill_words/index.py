@@ -0,0 +1,268 @@
+import json
+import os
+import time
+import boto3
+from collections import defaultdict
+
+from words_common.audio import (
+    AUDIO_CACHE_CONTROL,
+    AUDIO_FORMATS,
+    AUDIO_PREFIX,
+    DEFAULT_AUDIO_FORMAT,
+    s3file_key,
+)
+from words_common.questions import content_key
+from words_common.sampling import reserve_slots
+
+client = boto3.client("dynamodb")
+s3_client = boto3.client("s3")
+polly = boto3.client("polly")
+lambda_client = boto3.client("lambda")
+DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+BUCKET_NAME = os.environ["BUCKET_NAME"]
+WRITES_PER_SECOND = int(os.environ.get("WRITES_PER_SECOND", 1))
+# Copies only read the table, at the rate of its scan pages
+COPIES_PER_SECOND = int(os.environ.get("COPIES_PER_SECOND", 10))
+# Polly voice and engine by language, from the language registry
+VOICES = json.loads(os.environ["VOICES"])
+# Stop early and continue in a new invocation when less time than this is left
+REMAINING_TIME_THRESHOLD_MS = 30000
+AUDIO_S3FILE_PREFIX = f"s3://{BUCKET_NAME}/{AUDIO_PREFIX}"
+
+# Compact format synthesized for words saved before it was added
+COMPACT_FORMAT = "ogg_vorbis"
+
+# Words saved before sampling by slot get theirs first, as questions are only
+# sampled from words with a slot. Audio is then copied to its content-addressed
+# key for the whole table. Questions are served from the original keys until
+# the paced item updates point each word's s3file at its new key. Words then
+# get the audio formats added later.
+SLOT_PHASE = "slots"
+COPY_PHASE = "copy"
+UPDATE_PHASE = "update"
+FORMATS_PHASE = "formats"
+NEXT_PHASES = {
+    SLOT_PHASE: COPY_PHASE,
+    COPY_PHASE: UPDATE_PHASE,
+    UPDATE_PHASE: FORMATS_PHASE,
+}
+PHASE_FILTERS = {
+    SLOT_PHASE: "begins_with(pk, :prefix) AND attribute_not_exists(slot)",
+    COPY_PHASE: "begins_with(pk, :prefix) AND attribute_exists(s3file) "
+    "AND NOT begins_with(s3file, :audio)",
+    UPDATE_PHASE: "begins_with(pk, :prefix) AND attribute_exists(s3file) "
+    "AND NOT begins_with(s3file, :audio)",
+    FORMATS_PHASE: f"begins_with(pk, :prefix) AND attribute_not_exists(sizes.{COMPACT_FORMAT})",
+}
+ITEMS_PER_SECOND = {
+    SLOT_PHASE: WRITES_PER_SECOND,
+    COPY_PHASE: COPIES_PER_SECOND,
+    UPDATE_PHASE: WRITES_PER_SECOND,
+    FORMATS_PHASE: WRITES_PER_SECOND,
+}
+FILTER_VALUES = {
+    ":prefix": {"S": "Word#"},
+    ":audio": {"S": AUDIO_S3FILE_PREFIX},
+}
+
+
+def scan_pages(phase, exclusive_start_key=None):
+    kwargs = {
+        "TableName": DDB_TABLE_NAME,
+        "ProjectionExpression": "pk, sk, s3file, word, slot",
+        "FilterExpression": PHASE_FILTERS[phase],
+        "ExpressionAttributeValues": {
+            name: value
+            for name, value in FILTER_VALUES.items()
+            if name in PHASE_FILTERS[phase]
+        },
+        # Small pages keep the scan within the provisioned read capacity
+        "Limit": 100,
+    }
+    while True:
+        if exclusive_start_key:
+            kwargs["ExclusiveStartKey"] = exclusive_start_key
+        response = client.scan(**kwargs)
+        exclusive_start_key = response.get("LastEvaluatedKey")
+        yield response["Items"], exclusive_start_key
+        if not exclusive_start_key:
+            return
+
+
+def copy_audio(item):
+    source_key = s3file_key(item["s3file"]["S"])
+    try:
+        s3_client.copy_object(
+            Bucket=BUCKET_NAME,
+            Key=content_key(item),
+            CopySource={"Bucket": BUCKET_NAME, "Key": source_key},
+            CacheControl=AUDIO_CACHE_CONTROL,
+            ContentType=AUDIO_FORMATS[DEFAULT_AUDIO_FORMAT][0],
+            MetadataDirective="REPLACE",
+        )
+    except s3_client.exceptions.ClientError as e:
+        print(f"Failed to copy {source_key}: {e}")
+
+
+def reserve_page_slots(items):
+    """Reserve one slot per word without one, in one write per language."""
+    unslotted = defaultdict(list)
+    for item in items:
+        if "slot" not in item:
+            unslotted[item["pk"]["S"].split("#")[-1]].append(item)
+
+    slots = {}
+    for language, language_items in unslotted.items():
+        first_slot = reserve_slots(
+            client, DDB_TABLE_NAME, language, len(language_items)
+        )
+        for index, item in enumerate(language_items):
+            slots[(item["pk"]["S"], item["sk"]["S"])] = first_slot + index
+        time.sleep(1 / WRITES_PER_SECOND)
+    return slots
+
+
+def content_copied(item):
+    try:
+        s3_client.head_object(Bucket=BUCKET_NAME, Key=content_key(item))
+    except s3_client.exceptions.ClientError as e:
+        print(f"No audio at the content key of {item['sk']['S']}: {e}")
+        return False
+    return True
+
+
+def assign_slot(item, slot):
+    try:
+        client.update_item(
+            TableName=DDB_TABLE_NAME,
+            Key={"pk": item["pk"], "sk": item["sk"]},
+            # A slot left unused by a concurrent update is skipped by sampling
+            UpdateExpression="SET slot = if_not_exists(slot, :slot)",
+            ConditionExpression="attribute_exists(pk)",
+            ExpressionAttributeValues={":slot": {"N": str(slot)}},
+        )
+    except client.exceptions.ConditionalCheckFailedException:
+        pass
+
+
+def update_item(item):
+    # Words whose copy failed keep their s3file, so their audio is still
+    # served from the original key
+    if not content_copied(item):
+        return
+
+    try:
+        client.update_item(
+            TableName=DDB_TABLE_NAME,
+            Key={"pk": item["pk"], "sk": item["sk"]},
+            UpdateExpression="SET s3file = :s3file",
+            ConditionExpression="attribute_exists(pk)",
+            ExpressionAttributeValues={
+                ":s3file": {"S": f"s3://{BUCKET_NAME}/{content_key(item)}"}
+            },
+        )
+    except client.exceptions.ConditionalCheckFailedException:
+        pass
+
+
+def add_compact_audio(item):
+    language = item["pk"]["S"].split("#")[-1]
+    if language not in VOICES:
+        print(f"No voice for {language}, skipping {item['sk']['S']}")
+        return
+
+    try:
+        response = polly.synthesize_speech(
+            LanguageCode=language,
+            OutputFormat=COMPACT_FORMAT,
+            Text=item["word"]["S"],
+            **VOICES[language],
+        )
+    except polly.exceptions.ClientError as e:
+        print(f"Failed to synthesize {item['sk']['S']}: {e}")
+        return
+    with response["AudioStream"] as audio_stream:
+        audio = audio_stream.read()
+    s3_client.put_object(
+        Bucket=BUCKET_NAME,
+        Key=content_key(item, COMPACT_FORMAT),
+        Body=audio,
+        ContentType=response["ContentType"],
+        CacheControl=AUDIO_CACHE_CONTROL,
+    )
+
+    sizes = {COMPACT_FORMAT: {"N": str(len(audio))}}
+    try:
+        mp3 = s3_client.head_object(Bucket=BUCKET_NAME, Key=content_key(item))
+        sizes["mp3"] = {"N": str(mp3["ContentLength"])}
+    except s3_client.exceptions.ClientError as e:
+        print(f"Failed to read the mp3 size of {item['sk']['S']}: {e}")
+
+    try:
+        client.update_item(
+            TableName=DDB_TABLE_NAME,
+            Key={"pk": item["pk"], "sk": item["sk"]},
+            UpdateExpression="SET sizes = :sizes",
+            ConditionExpression="attribute_exists(pk)",
+            ExpressionAttributeValues={":sizes": {"M": sizes}},
+        )
+    except client.exceptions.ConditionalCheckFailedException:
+        pass
+
+
+def continue_backfill(context, phase, exclusive_start_key=None):
+    # Continue the backfill in a fresh invocation
+    payload = {"Phase": phase}
+    if exclusive_start_key:
+        payload["ExclusiveStartKey"] = exclusive_start_key
+    lambda_client.invoke(
+        FunctionName=context.function_name,
+        InvocationType="Event",
+        Payload=json.dumps(payload),
+    )
+
+
+def item_key(item):
+    return {"pk": item["pk"], "sk": item["sk"]}
+
+
+def lambda_handler(event, context):
+    phase = event.get("Phase", SLOT_PHASE)
+    processed = 0
+    start_key = event.get("ExclusiveStartKey")
+    for items, last_evaluated_key in scan_pages(phase, start_key):
+        # Slots of the words left for the next invocation stay empty
+        slots = reserve_page_slots(items) if phase == SLOT_PHASE else {}
+        for index, item in enumerate(items):
+            # Checked per item, a page takes longer than the threshold at the
+            # paced rate. The scan resumes after the last processed word.
+            if context.get_remaining_time_in_millis() < REMAINING_TIME_THRESHOLD_MS:
+                continue_backfill(
+                    context,
+                    phase,
+                    item_key(items[index - 1]) if index else start_key,
+                )
+                print(f"Backfilled {processed} items in the {phase} phase so far")
+                return {"phase": phase, "processed": processed}
+
+            if phase == SLOT_PHASE:
+                assign_slot(item, slots[(item["pk"]["S"], item["sk"]["S"])])
+            elif phase == COPY_PHASE:
+                copy_audio(item)
+            elif phase == UPDATE_PHASE:
+                update_item(item)
+            else:
+                add_compact_audio(item)
+            # Stay within the provisioned capacity of the table, and far below
+            # the Polly rate used by words generation
+            time.sleep(1 / ITEMS_PER_SECOND[phase])
+            processed += 1
+
+        if not last_evaluated_key:
+            if phase in NEXT_PHASES:
+                continue_backfill(context, NEXT_PHASES[phase])
+            break
+        start_key = last_evaluated_key
+
+    print(f"Backfilled {processed} items in the {phase} phase")
+    return {"phase": phase, "processed": processed}
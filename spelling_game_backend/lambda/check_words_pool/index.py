@@ -0,0 +1,110 @@
+import boto3
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from words_common.sampling import stats_key
+
+client = boto3.client("dynamodb")
+cloudwatch = boto3.client("cloudwatch")
+sfn = boto3.client("stepfunctions")
+DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+STATE_MACHINE_ARN = os.environ["STATE_MACHINE_ARN"]
+LOW_WATERMARK = int(os.environ["LOW_WATERMARK"])
+HIGH_WATERMARK = int(os.environ["HIGH_WATERMARK"])
+FRESHNESS_HOURS = int(os.environ["FRESHNESS_HOURS"])
+QUESTIONS_METRICS_NAMESPACE = "SpellingGame/Questions"
+
+
+def count_words(language):
+    """Count the words of a language once, when no pool stats exist yet."""
+    count = 0
+    kwargs = {
+        "TableName": DDB_TABLE_NAME,
+        "KeyConditionExpression": "pk = :pk",
+        "ExpressionAttributeValues": {":pk": {"S": f"Word#{language}"}},
+        "Select": "COUNT",
+    }
+    while True:
+        response = client.query(**kwargs)
+        count += response["Count"]
+        if "LastEvaluatedKey" not in response:
+            break
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    client.update_item(
+        TableName=DDB_TABLE_NAME,
+        Key=stats_key(language),
+        UpdateExpression="SET word_count = if_not_exists(word_count, :count)",
+        ExpressionAttributeValues={":count": {"N": str(count)}},
+    )
+    return count
+
+
+def pool_stats(language):
+    item = client.get_item(TableName=DDB_TABLE_NAME, Key=stats_key(language)).get(
+        "Item", {}
+    )
+    word_count = (
+        int(item["word_count"]["N"]) if "word_count" in item else count_words(language)
+    )
+    last_generated_at = (
+        datetime.fromisoformat(item["last_generated_at"]["S"])
+        if "last_generated_at" in item
+        else None
+    )
+    return word_count, last_generated_at
+
+
+def served_questions(language, since):
+    response = cloudwatch.get_metric_statistics(
+        Namespace=QUESTIONS_METRICS_NAMESPACE,
+        MetricName="QuestionsServed",
+        Dimensions=[{"Name": "Language", "Value": language}],
+        StartTime=since,
+        EndTime=datetime.now(timezone.utc),
+        Period=int((datetime.now(timezone.utc) - since).total_seconds()) // 60 * 60,
+        Statistics=["Sum"],
+    )
+    return sum(point["Sum"] for point in response["Datapoints"])
+
+
+def needs_words(language):
+    word_count, last_generated_at = pool_stats(language)
+    if word_count >= HIGH_WATERMARK:
+        return False, f"pool of {word_count} words is at the high watermark"
+    if word_count < LOW_WATERMARK:
+        return True, f"pool of {word_count} words is below the low watermark"
+
+    freshness_cutoff = datetime.now(timezone.utc) - timedelta(hours=FRESHNESS_HOURS)
+    if last_generated_at and last_generated_at > freshness_cutoff:
+        return False, "pool is fresh"
+
+    # Only refresh a stale pool that players are actually using
+    served = served_questions(language, freshness_cutoff)
+    if served > 0:
+        return True, f"pool is stale and served {served:.0f} questions"
+    return False, "pool is stale without demand"
+
+
+def lambda_handler(event, context):
+    # One execution generates words for every language whose pool needs them
+    needed = []
+    results = []
+    for language in event["languages"]:
+        generate, reason = needs_words(language["language"])
+        print(
+            f"{language['language']}: {'generating' if generate else 'skipping'}, {reason}"
+        )
+        if generate:
+            needed.append(language)
+        results.append(
+            {"language": language["language"], "generate": generate, "reason": reason}
+        )
+
+    if needed:
+        sfn.start_execution(
+            stateMachineArn=STATE_MACHINE_ARN, input=json.dumps({"languages": needed})
+        )
+
+    return {"languages": results}
@@ -1,33 +1,40 @@
 import boto3
 import os
 
+from words_common.audio import DEFAULT_AUDIO_FORMAT
+from words_common.questions import (
+    PRESIGNED_URL_EXPIRATION_SECONDS,
+    audio_path_item,
+    legacy_key,
+    presign_item,
+)
+
 s3_client = boto3.client("s3")
-PRESIGNED_URL_EXPIRATION_SECONDS = 120
 bucket_name = os.environ["BUCKET_NAME"]
+# Audio served through CloudFront is authorized by the signed cookies set by
+# /questions, so its questions only need the audio path
+AUDIO_DELIVERY = os.environ.get("AUDIO_DELIVERY", "presigned")
 
 
-def trasform_item(item):
-    return {
-        "id": item["sk"]["S"],
-        "description": item["description"]["S"],
-        "charcount": item["charcount"]["N"],
-        "language": item["pk"]["S"].split("#")[-1],
-        "word": item["word"]["S"],
-    }
+def question_item(item, expiration, formats):
+    # Audio not yet moved to its content-addressed key is outside the path
+    # served by CloudFront
+    if AUDIO_DELIVERY == "cloudfront" and not legacy_key(item):
+        return audio_path_item(item, formats)
+    return presign_item(s3_client, bucket_name, item, expiration, formats)
 
 
 def lambda_handler(event, context):
-    s3_file_path = event["item"]["s3file"]["S"]
-    object_key = s3_file_path.split(f"{bucket_name}/")[-1]
     expiration = event.get("expiration", PRESIGNED_URL_EXPIRATION_SECONDS)
-
-    presigned_url = s3_client.generate_presigned_url(
-        "get_object",
-        Params={"Bucket": bucket_name, "Key": object_key},
-        ExpiresIn=expiration,
-    )
-
-    item = trasform_item(event["item"])
-    item["url"] = presigned_url
-
-    return item
+    formats = event.get("formats", [DEFAULT_AUDIO_FORMAT])
+
+    # Batch mode presigns a whole question set in one invocation, skipping
+    # failed map iterations
+    if "items" in event:
+        return [
+            question_item(item, expiration, formats)
+            for item in event["items"]
+            if "sk" in item
+        ]
+
+    return question_item(event["item"], expiration, formats)
@@ -1,29 +1,84 @@
+import hmac
 import os
+import threading
+import time
+from datetime import datetime, timezone
 import boto3
 
 ssm = boto3.client("ssm")
 SSM_PARAMETER_NAME = os.environ["SSM_PARAMETER_NAME"]
 CUSTOM_HEADER_KEY = os.environ["CUSTOM_HEADER_KEY"]
 APIGW_PATH_PATTERN = os.environ["APIGW_PATH_PATTERN"]
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get("SECRET_CACHE_TTL_SECONDS", 60))
+# How long the previous value stays valid after a rotation, while CloudFront
+# deploys the new header value
+PREVIOUS_VALUE_GRACE_SECONDS = int(os.environ.get("PREVIOUS_VALUE_GRACE_SECONDS", 1800))
+# Retry a failed refresh after this long, serving the cached values meanwhile
+REFRESH_RETRY_SECONDS = 5
 
 resources = [
     f"{APIGW_PATH_PATTERN}questions",
     f"{APIGW_PATH_PATTERN}answers",
 ]
 
+secret_cache = {"values": [], "expires_at": 0}
+secret_cache_lock = threading.Lock()
 
-def fetch_header_value():
+
+def fetch_header_values():
     response = ssm.get_parameter(Name=SSM_PARAMETER_NAME, WithDecryption=True)
-    return response["Parameter"]["Value"]
+    parameter = response["Parameter"]
+    values = [parameter["Value"]]
+
+    rotated_seconds_ago = (
+        datetime.now(timezone.utc) - parameter["LastModifiedDate"]
+    ).total_seconds()
+    if parameter["Version"] > 1 and rotated_seconds_ago < PREVIOUS_VALUE_GRACE_SECONDS:
+        try:
+            response = ssm.get_parameter(
+                Name=f"{SSM_PARAMETER_NAME}:{parameter['Version'] - 1}",
+                WithDecryption=True,
+            )
+            values.append(response["Parameter"]["Value"])
+        except ssm.exceptions.ParameterVersionNotFound:
+            pass
+
+    return values
+
+
+def expected_header_values():
+    if time.monotonic() < secret_cache["expires_at"]:
+        return secret_cache["values"]
+
+    # Only one refresh at a time, others keep using the cached values
+    if not secret_cache_lock.acquire(blocking=not secret_cache["values"]):
+        return secret_cache["values"]
+
+    try:
+        secret_cache["values"] = fetch_header_values()
+        secret_cache["expires_at"] = time.monotonic() + SECRET_CACHE_TTL_SECONDS
+    except Exception as e:
+        if not secret_cache["values"]:
+            raise
+        print(f"Failed to refresh the header value, using the cached one: {e}")
+        secret_cache["expires_at"] = time.monotonic() + REFRESH_RETRY_SECONDS
+    finally:
+        secret_cache_lock.release()
+
+    return secret_cache["values"]
 
 
 def lambda_handler(event, context):
     headers = event.get("headers", {})
     api_key = headers.get(CUSTOM_HEADER_KEY, None)
-    expected_key = fetch_header_value()
+    expected_keys = expected_header_values()
 
     effect = "Deny"
-    if api_key == expected_key:
+    # Compared as bytes, str arguments must be ASCII or compare_digest raises
+    if api_key and any(
+        hmac.compare_digest(api_key.encode("utf-8"), expected_key.encode("utf-8"))
+        for expected_key in expected_keys
+    ):
         effect = "Allow"
 
     return {
@@ -2,8 +2,141 @@ import json
 import boto3
 import os
 
-client = boto3.client("stepfunctions")
-STATE_MACHINE_ARN = os.environ["STATE_MACHINE_ARN"]
+from words_common.audio import (
+    AUDIO_PREFIX,
+    DEFAULT_AUDIO_FORMAT,
+    accepted_formats,
+    audio_key,
+    choose_format,
+)
+from words_common.bundles import bundle_audio, inline_bundle, save_bundle
+from words_common.decks import DECK_SIZE, read_decks
+from words_common.metrics import put_metrics
+from words_common.presign import presigned_url_cache
+from words_common.questions import (
+    PRESIGNED_URL_EXPIRATION_SECONDS,
+    audio_path_item,
+    legacy_key,
+    presign_item,
+    unique_questions,
+)
+from words_common.sampling import sample_words
+from words_common.signed_cookies import SignedCookies, load_private_key
+
+QUESTIONS_MODE = os.environ.get("QUESTIONS_MODE", "direct")
+QUESTIONS_COUNT = 5
+# Read by the words generation scheduler to gauge demand per language
+METRICS_NAMESPACE = "SpellingGame/Questions"
+MAX_QUESTIONS_COUNT = 20
+# Rounds of distinct questions a client can prefetch in one request
+MAX_ROUNDS = 5
+# Extra state machine iterations so duplicates can be dropped without a rerun
+STATE_MACHINE_OVERSAMPLE = 3
+AUDIO_DELIVERY = os.environ.get("AUDIO_DELIVERY", "presigned")
+AUDIO_PATH = "/audio/"
+# Bundles up to this size are returned inline instead of saved to S3
+INLINE_BUNDLE_MAX_BYTES = int(os.environ.get("INLINE_BUNDLE_MAX_BYTES", 65536))
+
+s3_client = boto3.client("s3")
+BUCKET_NAME = os.environ["BUCKET_NAME"]
+
+if QUESTIONS_MODE == "state_machine":
+    client = boto3.client("stepfunctions")
+    STATE_MACHINE_ARN = os.environ["STATE_MACHINE_ARN"]
+else:
+    ddb_client = boto3.client("dynamodb")
+    DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+    SAMPLING_INDEX_NAME = os.environ["SAMPLING_INDEX_NAME"]
+
+# Audio served through CloudFront is authorized once per session with signed
+# cookies instead of a presigned URL per question
+if AUDIO_DELIVERY == "cloudfront":
+    ssm_client = boto3.client("ssm")
+    signed_cookies = SignedCookies(
+        os.environ["AUDIO_KEY_PAIR_ID"],
+        load_private_key(
+            ssm_client.get_parameter(
+                Name=os.environ["AUDIO_PRIVATE_KEY_SSM_PARAMETER"],
+                WithDecryption=True,
+            )["Parameter"]["Value"]
+        ),
+        AUDIO_PATH,
+        int(os.environ["AUDIO_COOKIE_LIFETIME_SECONDS"]),
+    )
+
+
+def question_item(item, formats):
+    # Audio not yet moved to its content-addressed key is outside the path
+    # served by CloudFront
+    if AUDIO_DELIVERY == "cloudfront" and not legacy_key(item):
+        return audio_path_item(item, formats)
+    return presign_item(
+        s3_client, BUCKET_NAME, item, PRESIGNED_URL_EXPIRATION_SECONDS, formats
+    )
+
+
+def audio_url(key):
+    if AUDIO_DELIVERY == "cloudfront" and key.startswith(AUDIO_PREFIX):
+        return f"/{key}"
+    return presigned_url_cache.url(
+        s3_client, BUCKET_NAME, key, PRESIGNED_URL_EXPIRATION_SECONDS
+    )
+
+
+def questions_from_state_machine(language, count, formats):
+    # Start the Step Function execution
+    response = client.start_sync_execution(
+        stateMachineArn=STATE_MACHINE_ARN,
+        input=json.dumps(
+            {
+                "language": language,
+                "count": count,
+                "formats": formats,
+                "iterate": [
+                    str(i) for i in range(1, count + STATE_MACHINE_OVERSAMPLE + 1)
+                ],
+            }
+        ),
+    )
+
+    return json.loads(response["output"])
+
+
+def questions_from_table(language, count, formats):
+    items = sample_words(
+        ddb_client, DDB_TABLE_NAME, SAMPLING_INDEX_NAME, language, count
+    )
+
+    return unique_questions([question_item(item, formats) for item in items])
+
+
+def questions_from_deck(language, count, formats, rounds):
+    # Decks only hold the default number of questions, one deck per round
+    questions = (
+        read_decks(ddb_client, DDB_TABLE_NAME, language, rounds)
+        if count == DECK_SIZE
+        else None
+    )
+    if not questions:
+        return questions_from_table(language, count * rounds, formats)
+
+    for question in questions:
+        key = question["key"]
+        audio_format = choose_format(question.pop("sizes", {}), formats)
+        if audio_format != DEFAULT_AUDIO_FORMAT:
+            key = audio_key(question["language"], question["id"], audio_format)
+        question["url"] = audio_url(key)
+        question["format"] = audio_format
+
+    return questions
+
+
+def audio_bundle(questions, keys):
+    """One audio resource for the whole question set, inline when small."""
+    bundle = bundle_audio(s3_client, BUCKET_NAME, questions, keys)
+    if len(bundle) <= INLINE_BUNDLE_MAX_BYTES:
+        return inline_bundle(bundle)
+    return {"url": audio_url(save_bundle(s3_client, BUCKET_NAME, bundle))}
 
 
 def lambda_handler(event, context):
@@ -14,26 +147,69 @@ def lambda_handler(event, context):
         "Access-Control-Allow-Headers": "Content-Type, X-apigw-cloudfront-token",
     }
     try:
-        # Start the Step Function execution
-        response = client.start_sync_execution(
-            stateMachineArn=STATE_MACHINE_ARN,
-            input=json.dumps(
-                {"language": payload["language"], "iterate": ["1", "2", "3", "4", "5"]}
-            ),
+        count = max(
+            1, min(int(payload.get("count", QUESTIONS_COUNT)), MAX_QUESTIONS_COUNT)
         )
+        # All rounds are sampled at once, so their words are distinct
+        rounds = max(1, min(int(payload.get("rounds", 1)), MAX_ROUNDS))
+    except (TypeError, ValueError) as e:
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"message": "Invalid request", "error": str(e)}),
+            "headers": output_headers,
+        }
+    # The smallest audio format the client accepts is served per question
+    headers = {
+        name.lower(): value for name, value in (event.get("headers") or {}).items()
+    }
+    formats = accepted_formats(payload.get("formats"), headers.get("accept"))
+    try:
+        if QUESTIONS_MODE == "state_machine":
+            questions = questions_from_state_machine(
+                payload["language"], count * rounds, formats
+            )
+        elif QUESTIONS_MODE == "deck":
+            questions = questions_from_deck(payload["language"], count, formats, rounds)
+        else:
+            questions = questions_from_table(
+                payload["language"], count * rounds, formats
+            )
+
+        # The mp3 key of each question, its original one until migrated
+        keys = [
+            question.pop("key", None) or audio_key(question["language"], question["id"])
+            for question in questions
+        ]
 
-        questions = json.loads(response["output"])
         for item in questions:
             if "charcount" in item:
                 item["charcount"] = int(item["charcount"])
             if "description" in item:
                 item["description"] = item["description"].strip().capitalize()
 
-        return {
+        put_metrics(
+            METRICS_NAMESPACE,
+            {"Language": payload["language"]},
+            {"QuestionsServed": len(questions)},
+        )
+
+        body = {"questions": questions[:count]}
+        if rounds > 1:
+            body["rounds"] = [
+                questions[i : i + count] for i in range(0, len(questions), count)
+            ]
+        if payload.get("bundle"):
+            body["bundle"] = audio_bundle(questions, keys)
+
+        response = {
             "statusCode": 200,
-            "body": json.dumps({"questions": questions}),
+            "body": json.dumps(body),
             "headers": output_headers,
         }
+        if AUDIO_DELIVERY == "cloudfront":
+            response["multiValueHeaders"] = {"Set-Cookie": signed_cookies.headers()}
+
+        return response
     except Exception as e:
         return {
             "statusCode": 500,
@@ -0,0 +1,71 @@
+import json
+import boto3
+import math
+import os
+from datetime import datetime, timezone
+
+from words_common.ddb import BATCH_WRITE_MAX_ITEMS
+from words_common.decks import DECK_POOL_SIZE, DECK_SIZE, deck_key, deck_question
+from words_common.rate_limit import SharedRateLimiter
+from words_common.sampling import sample_words
+
+client = boto3.client("dynamodb")
+DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+SAMPLING_INDEX_NAME = os.environ["SAMPLING_INDEX_NAME"]
+RATE_LIMIT_TABLE_NAME = os.environ["RATE_LIMIT_TABLE_NAME"]
+# Provisioned write capacity of the table
+WRITES_PER_SECOND = int(os.environ.get("WRITES_PER_SECOND", 2))
+# Deck writes share the words table capacity with the words generator, so they
+# draw from the same bucket as PersistWords
+write_limiter = SharedRateLimiter(
+    client,
+    RATE_LIMIT_TABLE_NAME,
+    "dynamodb-writes",
+    WRITES_PER_SECOND,
+    burst=BATCH_WRITE_MAX_ITEMS,
+)
+
+
+def build_decks(language):
+    built = 0
+    for slot in range(DECK_POOL_SIZE):
+        items = sample_words(
+            client, DDB_TABLE_NAME, SAMPLING_INDEX_NAME, language, DECK_SIZE
+        )
+        if len(items) < DECK_SIZE:
+            print(f"Not enough words to build {language} decks")
+            break
+
+        questions = json.dumps([deck_question(item) for item in items])
+        # A write unit per started KB of the deck
+        write_limiter.acquire(math.ceil(len(questions.encode("utf-8")) / 1024))
+        client.put_item(
+            TableName=DDB_TABLE_NAME,
+            Item={
+                **deck_key(language, slot),
+                "questions": {"S": questions},
+                "updated_at": {"S": datetime.now(timezone.utc).isoformat()},
+            },
+        )
+        built += 1
+
+    return built
+
+
+def lambda_handler(event, context):
+    if "detail" in event:
+        # Triggered by the successful execution of the words generator state machine
+        languages = [
+            language["language"]
+            for language in json.loads(event["detail"]["input"])["languages"]
+        ]
+    else:
+        # Scheduled refresh of every registered language
+        languages = event["languages"]
+
+    built = {}
+    for language in languages:
+        built[language] = build_decks(language)
+        print(f"Built {built[language]} {language} decks")
+
+    return {"built": built}
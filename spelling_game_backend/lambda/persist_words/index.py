@@ -0,0 +1,91 @@
+import boto3
+import hashlib
+import os
+from datetime import datetime, timezone
+
+from words_common.ddb import BATCH_WRITE_MAX_ITEMS, batch_write_items
+from words_common.rate_limit import SharedRateLimiter
+from words_common.sampling import reserve_slots, stats_key
+
+client = boto3.client("dynamodb")
+DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+RATE_LIMIT_TABLE_NAME = os.environ["RATE_LIMIT_TABLE_NAME"]
+# Provisioned write capacity of the table
+WRITES_PER_SECOND = int(os.environ.get("WRITES_PER_SECOND", 2))
+# Leave time to report unwritten words before the function times out
+TIME_BUDGET_SECONDS = 240
+# Languages are saved in parallel, so their writes to the words table share
+# one bucket, kept in a table of its own
+write_limiter = SharedRateLimiter(
+    client,
+    RATE_LIMIT_TABLE_NAME,
+    "dynamodb-writes",
+    WRITES_PER_SECOND,
+    burst=BATCH_WRITE_MAX_ITEMS,
+)
+
+
+def word_item(language, record, slot, updated_at):
+    item = {
+        "pk": {"S": f"Word#{language}"},
+        # Same as States.Hash($.word, 'MD5')
+        "sk": {"S": hashlib.md5(record["word"].encode("utf-8")).hexdigest()},
+        "word": {"S": record["word"]},
+        "description": {"S": record["description"]},
+        "s3file": {"S": record["s3file"]},
+        "charcount": {"N": str(record["charcount"])},
+        "slot": {"N": str(slot)},
+        "updated_at": {"S": updated_at},
+    }
+    # Audio sizes by format, only mp3 is synthesized by the asynchronous path
+    if "sizes" in record:
+        item["sizes"] = {
+            "M": {
+                audio_format: {"N": str(size)}
+                for audio_format, size in record["sizes"].items()
+            }
+        }
+    return item
+
+
+def lambda_handler(event, context):
+    language = event["language"]
+    updated_at = datetime.now(timezone.utc).isoformat()
+    # Skip failed map iterations of the asynchronous synthesis path
+    records = [record for record in event["words"] if "word" in record]
+
+    # One reservation numbers the whole batch for uniform sampling. Like the
+    # pool stats update, it is a write of the table paced by the bucket.
+    first_slot = 0
+    if records:
+        write_limiter.acquire()
+        first_slot = reserve_slots(client, DDB_TABLE_NAME, language, len(records))
+    items = [
+        word_item(language, record, first_slot + index, updated_at)
+        for index, record in enumerate(records)
+    ]
+
+    unprocessed = batch_write_items(
+        client,
+        DDB_TABLE_NAME,
+        items,
+        WRITES_PER_SECOND,
+        time_budget_seconds=TIME_BUDGET_SECONDS,
+        limiter=write_limiter,
+    )
+    if unprocessed:
+        raise RuntimeError(f"{len(unprocessed)} of {len(items)} words were not saved")
+
+    # Pool size and freshness read by the words generation scheduler
+    write_limiter.acquire()
+    client.update_item(
+        TableName=DDB_TABLE_NAME,
+        Key=stats_key(language),
+        UpdateExpression="ADD word_count :count SET last_generated_at = :updated_at",
+        ExpressionAttributeValues={
+            ":count": {"N": str(len(items))},
+            ":updated_at": {"S": updated_at},
+        },
+    )
+
+    return {"saved": len(items)}
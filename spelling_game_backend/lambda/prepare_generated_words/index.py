@@ -0,0 +1,133 @@
+import boto3
+import hashlib
+import json
+import os
+
+from words_common.ddb import batch_get_items
+from words_common.metrics import put_metrics
+
+client = boto3.client("dynamodb")
+DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+METRICS_NAMESPACE = "SpellingGame/WordsGeneration"
+# Same bounds as asked for in the generation prompt
+MIN_WORD_LENGTH = 5
+MAX_WORD_LENGTH = 9
+
+
+def word_id(word):
+    # Same as States.Hash($.word, 'MD5') used for the sk when saving a word
+    return hashlib.md5(word.encode("utf-8")).hexdigest()
+
+
+def parse_words(text):
+    """Parse the model's JSON array one object at a time.
+
+    A malformed object is skipped and a truncated tail ends the parsing, so
+    only those words are lost instead of the whole batch.
+    """
+    decoder = json.JSONDecoder()
+    words = []
+    index = text.find("[") + 1
+
+    while 0 < index < len(text):
+        index = text.find("{", index)
+        if index < 0:
+            break
+        try:
+            item, index = decoder.raw_decode(text, index)
+        except json.JSONDecodeError:
+            # Resynchronize on the next object
+            index += 1
+            continue
+
+        if isinstance(item, dict) and all(
+            isinstance(item.get(key), str) for key in ("word", "description")
+        ):
+            words.append({"word": item["word"], "description": item["description"]})
+
+    return words
+
+
+def rejection_reason(word, alphabet):
+    if len(word.split()) != 1:
+        return "NotSingleWord"
+    if not MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH:
+        return "WrongLength"
+    if word != word.lower():
+        return "NotLowercase"
+    if alphabet and not set(word) <= set(alphabet):
+        return "WrongAlphabet"
+    return None
+
+
+def filter_words(words, alphabet):
+    """Drop words breaking the generation rules before any paid call is made.
+
+    Returns the valid words, without duplicates, and the rejection counts
+    by reason.
+    """
+    valid = []
+    seen = set()
+    rejected = {}
+
+    for item in words:
+        word = item["word"].strip()
+        reason = rejection_reason(word, alphabet)
+        if reason is None and word in seen:
+            reason = "Duplicate"
+        if reason is None and not item["description"].strip():
+            reason = "NoDescription"
+
+        if reason:
+            rejected[reason] = rejected.get(reason, 0) + 1
+            continue
+
+        seen.add(word)
+        valid.append({"word": word, "description": item["description"].strip()})
+
+    return valid, rejected
+
+
+def remove_existing_words(language, words):
+    """Drop words that are already saved for the language."""
+    items, unprocessed = batch_get_items(
+        client,
+        DDB_TABLE_NAME,
+        [
+            {"pk": {"S": f"Word#{language}"}, "sk": {"S": word_id(item["word"])}}
+            for item in words
+        ],
+        projection_expression="sk",
+    )
+    if unprocessed:
+        raise RuntimeError(f"{len(unprocessed)} words could not be checked")
+
+    existing_ids = {item["sk"]["S"] for item in items}
+    return [item for item in words if word_id(item["word"]) not in existing_ids]
+
+
+def lambda_handler(event, context):
+    language = event["language"]
+    generated = parse_words(event["text"])
+    words, rejected = filter_words(generated, event.get("alphabet"))
+    for reason, count in rejected.items():
+        print(f"Rejected {count} {language} words: {reason}")
+
+    new_words = remove_existing_words(language, words) if words else []
+
+    put_metrics(
+        METRICS_NAMESPACE,
+        {"Language": language},
+        {
+            "GeneratedWords": len(generated),
+            "RejectedWords": len(generated) - len(words),
+            "SkippedExistingWords": len(words) - len(new_words),
+            "NewWords": len(new_words),
+        },
+    )
+
+    return {
+        "words": new_words,
+        "skipped": len(words) - len(new_words),
+        "rejected": rejected,
+    }
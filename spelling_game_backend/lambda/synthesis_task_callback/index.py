@@ -0,0 +1,73 @@
+import json
+import boto3
+import os
+import time
+
+client = boto3.client("dynamodb")
+polly = boto3.client("polly")
+sfn = boto3.client("stepfunctions")
+DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+# Tokens outlive the state machine wait, DynamoDB removes them afterwards
+TOKEN_TTL_SECONDS = 3600
+
+
+def task_key(task_id):
+    return {"pk": {"S": f"SynthesisTask#{task_id}"}, "sk": {"S": "TaskToken"}}
+
+
+def register_task(task_id, task_token):
+    client.put_item(
+        TableName=DDB_TABLE_NAME,
+        Item={
+            **task_key(task_id),
+            "token": {"S": task_token},
+            "ttl": {"N": str(int(time.time()) + TOKEN_TTL_SECONDS)},
+        },
+    )
+
+
+def complete_task(task_id):
+    task = polly.get_speech_synthesis_task(TaskId=task_id)["SynthesisTask"]
+    if task["TaskStatus"] not in ("completed", "failed"):
+        return
+
+    # Deleting the token claims it, so the execution is resumed only once
+    try:
+        response = client.delete_item(
+            TableName=DDB_TABLE_NAME,
+            Key=task_key(task_id),
+            ConditionExpression="attribute_exists(pk)",
+            ReturnValues="ALL_OLD",
+        )
+    except client.exceptions.ConditionalCheckFailedException:
+        return
+    task_token = response["Attributes"]["token"]["S"]
+
+    try:
+        if task["TaskStatus"] == "completed":
+            sfn.send_task_success(
+                taskToken=task_token,
+                output=json.dumps({"SynthesisTask": task}, default=str),
+            )
+        else:
+            sfn.send_task_failure(
+                taskToken=task_token,
+                error="SynthesisTaskFailed",
+                cause=task.get("TaskStatusReason", ""),
+            )
+    except (sfn.exceptions.TaskTimedOut, sfn.exceptions.InvalidToken):
+        # The execution already moved on to polling the task status
+        print(f"Execution for synthesis task {task_id} is no longer waiting")
+
+
+def lambda_handler(event, context):
+    # Polly task notification through SNS
+    if "Records" in event:
+        for record in event["Records"]:
+            complete_task(json.loads(record["Sns"]["Message"])["taskId"])
+        return
+
+    # Invoked by the state machine with a task token. The task may already
+    # have finished before the token was stored, so check it once here.
+    register_task(event["taskId"], event["taskToken"])
+    complete_task(event["taskId"])
@@ -0,0 +1,96 @@
+import boto3
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from words_common.audio import AUDIO_CACHE_CONTROL, AUDIO_FORMATS, audio_key
+from words_common.rate_limit import SharedRateLimiter
+
+polly = boto3.client("polly")
+s3_client = boto3.client("s3")
+client = boto3.client("dynamodb")
+BUCKET_NAME = os.environ["BUCKET_NAME"]
+RATE_LIMIT_TABLE_NAME = os.environ["RATE_LIMIT_TABLE_NAME"]
+DEFAULT_CONCURRENCY = int(os.environ.get("MAX_CONCURRENCY", 4))
+# Shared by all languages and runs so their calls stay within Polly's limit
+polly_limiter = SharedRateLimiter(
+    client,
+    RATE_LIMIT_TABLE_NAME,
+    "polly",
+    float(os.environ["POLLY_REQUESTS_PER_SECOND"]),
+)
+
+
+def synthesize_audio(language, word, audio_format):
+    """Save the word's audio in the format, returning its size and characters."""
+    polly_limiter.acquire()
+    response = polly.synthesize_speech(
+        LanguageCode=language["language"],
+        OutputFormat=audio_format,
+        Text=word,
+        VoiceId=language["voiceId"],
+        Engine=language["engine"],
+    )
+    with response["AudioStream"] as audio_stream:
+        audio = audio_stream.read()
+
+    # Derived from the word's sk, so synthesizing a word again overwrites its audio
+    s3_client.put_object(
+        Bucket=BUCKET_NAME,
+        Key=audio_key(
+            language["language"],
+            hashlib.md5(word.encode("utf-8")).hexdigest(),
+            audio_format,
+        ),
+        Body=audio,
+        ContentType=response["ContentType"],
+        CacheControl=AUDIO_CACHE_CONTROL,
+    )
+    return len(audio), response["RequestCharacters"]
+
+
+def synthesize_word(language, item):
+    # Every format is stored, so questions can be served in the smallest
+    # one the client plays
+    sizes = {}
+    for audio_format in AUDIO_FORMATS:
+        sizes[audio_format], charcount = synthesize_audio(
+            language, item["word"], audio_format
+        )
+
+    key = audio_key(
+        language["language"], hashlib.md5(item["word"].encode("utf-8")).hexdigest()
+    )
+    return {
+        "language": language["language"],
+        "word": item["word"],
+        "description": item["description"],
+        "s3file": f"s3://{BUCKET_NAME}/{key}",
+        "charcount": charcount,
+        "sizes": sizes,
+    }
+
+
+def lambda_handler(event, context):
+    # Voice and engine come from the language registry
+    language = event["language"]
+    words = []
+    failed = []
+
+    max_workers = int(language.get("synthesisConcurrency", DEFAULT_CONCURRENCY))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (item, executor.submit(synthesize_word, language, item))
+            for item in event["words"]
+        ]
+        for item, future in futures:
+            try:
+                words.append(future.result())
+            except Exception as e:
+                print(f"Failed to synthesize {item['word']}: {e}")
+                failed.append(item)
+
+    if failed and not words:
+        raise RuntimeError(f"Failed to synthesize all {len(failed)} words")
+
+    return {"words": words, "failed": failed}
@@ -1,56 +1,112 @@
+import hashlib
 import json
 import boto3
 import os
+import unicodedata
+
+from words_common.cache import words_cache
+from words_common.ddb import batch_get_items
+from words_common.metrics import put_metrics
 
 client = boto3.client("dynamodb")
 DDB_TABLE_NAME = os.environ["DDB_TABLE_NAME"]
+METRICS_NAMESPACE = "SpellingGame/Answers"
 
 
-def lambda_handler(event, context):
-    payload = json.loads(event["body"])
+def normalize(word):
+    # Accented letters typed as a letter and a combining mark compare equal to
+    # the composed letters words are saved with
+    return unicodedata.normalize("NFC", word.strip()).lower()
 
-    # Get DynamoDB keys from inputs
-    keys = [
-        {
-            "pk": {"S": f"Word#{payload["language"]}"},
-            "sk": {"S": item["id"]},
-        }
-        for item in payload["answers"]
-    ]
 
-    # BatchGetItem from DynamoDB
-    response = client.batch_get_item(
-        RequestItems={
-            f"{DDB_TABLE_NAME}": {
-                "Keys": keys,
-                "ProjectionExpression": "sk, word",
-            },
+def word_id(word):
+    # Same as States.Hash($.word, 'MD5') used for the sk when saving a word
+    return hashlib.md5(normalize(word).encode("utf-8")).hexdigest()
+
+
+def fetch_original_words(language, ids):
+    original_words = {}
+    missing_ids = []
+    for sk in ids:
+        word = words_cache.get(language, sk)
+        if word:
+            original_words[sk] = word
+        else:
+            missing_ids.append(sk)
+
+    if missing_ids:
+        items, unprocessed = batch_get_items(
+            client,
+            DDB_TABLE_NAME,
+            [{"pk": {"S": f"Word#{language}"}, "sk": {"S": sk}} for sk in missing_ids],
+            "pk, sk, word",
+        )
+        if unprocessed:
+            raise RuntimeError(f"{len(unprocessed)} words could not be read")
+
+        words_cache.put_items(items)
+        for item in items:
+            original_words[item["sk"]["S"]] = item["word"]["S"]
+
+    put_metrics(
+        METRICS_NAMESPACE,
+        {"Language": language},
+        {
+            "WordsCacheHits": len(ids) - len(missing_ids),
+            "WordsCacheMisses": len(missing_ids),
+            "WordsCacheSize": words_cache.stats()["size"],
         },
     )
+    return original_words
 
-    # Process the results
-    results_from_db = {
-        item["sk"]["S"]: item["word"]["S"]
-        for item in response["Responses"][DDB_TABLE_NAME]
-    }
 
-    # Compare each input against DynamoDB data
-    results = [
-        {
-            "id": item["id"],
-            "original_word": results_from_db.get(item["id"], None),
-            "correct": results_from_db.get(item["id"], "").lower()
-            == item["word"].lower(),
-        }
-        for item in payload["answers"]
-    ]
+def lambda_handler(event, context):
+    payload = json.loads(event["body"])
+    language = payload["language"]
 
+    # An answer is correct when its hash matches the word id, so only wrong
+    # answers need the original word from DynamoDB
+    answers = [
+        (item, word_id(item["word"]) == item["id"]) for item in payload["answers"]
+    ]
+    wrong_ids = list(
+        dict.fromkeys(item["id"] for item, correct in answers if not correct)
+    )
     output_headers = {
         "Access-Control-Allow-Origin": "*",  # TODO: update with the domain input
         "Access-Control-Allow-Methods": "OPTIONS, POST",
         "Access-Control-Allow-Headers": "Content-Type, X-apigw-cloudfront-token",
     }
 
+    try:
+        results_from_db = fetch_original_words(language, wrong_ids) if wrong_ids else {}
+    except Exception as e:
+        # Throttled reads must not turn into wrong answers
+        return {
+            "statusCode": 503,
+            "body": json.dumps({"message": "Please try again", "error": str(e)}),
+            "headers": output_headers,
+        }
+
+    # Compare each input against the word id or DynamoDB data
+    results = [
+        (
+            {
+                "id": item["id"],
+                "original_word": normalize(item["word"]),
+                "correct": True,
+            }
+            if correct
+            else {
+                "id": item["id"],
+                "original_word": results_from_db.get(item["id"], None),
+                "correct": normalize(results_from_db.get(item["id"], ""))
+                == normalize(item["word"]),
+            }
+        )
+        for item, correct in answers
+    ]
+
     return {
         "statusCode": 200,
         "body": json.dumps(results),
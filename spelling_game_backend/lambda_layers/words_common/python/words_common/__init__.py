@@ -0,0 +1 @@
+"""Code shared by the words backend Lambda functions."""
@@ -0,0 +1,54 @@
+"""Content-addressed audio objects."""
+
+from urllib.parse import urlparse
+
+# Keys never change content, so the audio can be cached for good
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+AUDIO_CONTENT_TYPE = "audio/mpeg"
+
+# Polly output formats stored for every word, by content type and extension.
+# Every word has mp3 audio, the others may still be missing for older words.
+AUDIO_FORMATS = {
+    "mp3": ("audio/mpeg", "mp3"),
+    "ogg_vorbis": ("audio/ogg", "ogg"),
+}
+DEFAULT_AUDIO_FORMAT = "mp3"
+# Prefix of every content-addressed key, the path served through CloudFront
+AUDIO_PREFIX = "audio/"
+
+
+def audio_key(language, word_id, audio_format=DEFAULT_AUDIO_FORMAT):
+    """Key of a word's audio, derived from its language, MD5 id and format."""
+    return f"{AUDIO_PREFIX}{language}/{word_id}.{AUDIO_FORMATS[audio_format][1]}"
+
+
+def s3file_key(s3file):
+    """Object key of an s3:// URI or a path-style Polly task output URL."""
+    if s3file.startswith("s3://"):
+        return s3file.split("/", 3)[3]
+    return urlparse(s3file).path.split("/", 2)[2]
+
+
+def accepted_formats(requested=None, accept_header=None):
+    """Formats the client accepts, from the request field or Accept header."""
+    if requested:
+        formats = [
+            audio_format for audio_format in requested if audio_format in AUDIO_FORMATS
+        ]
+    elif accept_header:
+        formats = [
+            audio_format
+            for audio_format, (content_type, _) in AUDIO_FORMATS.items()
+            if content_type in accept_header
+        ]
+    else:
+        formats = []
+    return formats or [DEFAULT_AUDIO_FORMAT]
+
+
+def choose_format(sizes, formats):
+    """Smallest of the accepted formats stored for a word, mp3 otherwise."""
+    available = [audio_format for audio_format in formats if audio_format in sizes]
+    if not available:
+        return DEFAULT_AUDIO_FORMAT
+    return min(available, key=sizes.get)
@@ -0,0 +1,122 @@
+"""Audio of a whole question set in a single resource."""
+
+import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from words_common.audio import AUDIO_CONTENT_TYPE, audio_key
+
+# Kilobits per second by bitrate index, for MPEG-1 and MPEG-2/2.5 layer III
+MP3_BITRATES = {
+    3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+# Hertz by sample rate index, for MPEG-1, MPEG-2 and MPEG-2.5
+MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000],
+}
+BUNDLE_FETCH_CONCURRENCY = 5
+BUNDLE_PREFIX = "audio/bundles/"
+# Saved bundles expire after a day by the lifecycle rule of the words bucket,
+# so caches must not keep them longer
+BUNDLE_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _skip_id3(data):
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    return 10 + size
+
+
+def mp3_duration_ms(data):
+    """Duration of MP3 audio, summed over its layer III frame headers."""
+    index = _skip_id3(data)
+    duration = 0.0
+
+    while index + 4 <= len(data):
+        header = int.from_bytes(data[index : index + 4], "big")
+        version = (header >> 19) & 0x3
+        layer = (header >> 17) & 0x3
+        bitrate_index = (header >> 12) & 0xF
+        sample_rate_index = (header >> 10) & 0x3
+        if (
+            header >> 21 != 0x7FF
+            or version == 1
+            or layer != 1
+            or bitrate_index in (0, 15)
+            or sample_rate_index == 3
+        ):
+            # Not a frame header, resynchronize on the next byte
+            index += 1
+            continue
+
+        bitrate = MP3_BITRATES[3 if version == 3 else 2][bitrate_index] * 1000
+        sample_rate = MP3_SAMPLE_RATES[version][sample_rate_index]
+        samples = 1152 if version == 3 else 576
+        padding = (header >> 9) & 0x1
+        frame_length = samples // 8 * bitrate // sample_rate + padding
+        if index + frame_length > len(data):
+            # A truncated last frame isn't played
+            break
+        index += frame_length
+        duration += samples / sample_rate
+
+    return int(duration * 1000)
+
+
+def bundle_audio(s3_client, bucket_name, questions, keys=None):
+    """Concatenate the audio of the questions into one MP3.
+
+    Reads the mp3 keys given in the order of the questions, their
+    content-addressed keys otherwise. Sets the byte offset, length and
+    duration of its clip in each question, and returns the bundle.
+    """
+    keys = keys or [
+        audio_key(question["language"], question["id"]) for question in questions
+    ]
+    with ThreadPoolExecutor(max_workers=BUNDLE_FETCH_CONCURRENCY) as executor:
+        clips = list(
+            executor.map(
+                lambda key: s3_client.get_object(Bucket=bucket_name, Key=key)[
+                    "Body"
+                ].read(),
+                keys,
+            )
+        )
+
+    offset = 0
+    for question, clip in zip(questions, clips):
+        question["audio"] = {
+            "offset": offset,
+            "length": len(clip),
+            "duration": mp3_duration_ms(clip),
+        }
+        offset += len(clip)
+
+    return b"".join(clips)
+
+
+def inline_bundle(bundle):
+    """Return the bundle base64 encoded, to be sent with the questions."""
+    return {
+        "contentType": AUDIO_CONTENT_TYPE,
+        "data": base64.b64encode(bundle).decode("ascii"),
+    }
+
+
+def save_bundle(s3_client, bucket_name, bundle):
+    """Save the bundle under its content hash and return its key."""
+    key = f"{BUNDLE_PREFIX}{hashlib.md5(bundle).hexdigest()}.mp3"
+    s3_client.put_object(
+        Bucket=bucket_name,
+        Key=key,
+        Body=bundle,
+        ContentType=AUDIO_CONTENT_TYPE,
+        CacheControl=BUNDLE_CACHE_CONTROL,
+    )
+    return key
@@ -0,0 +1,58 @@
+"""Warm-container cache of words."""
+
+import threading
+import time
+from collections import OrderedDict
+
+WORDS_CACHE_SIZE = 2000
+# Words never change once saved, the TTL only bounds removed words
+WORDS_CACHE_TTL_SECONDS = 3600
+
+
+class WordCache:
+    """Size-bounded LRU cache of words keyed by (language, sk).
+
+    Only the word itself is kept, as that is all its readers use. Lambda
+    functions don't share memory, so each one fills its own cache from the
+    words it reads.
+    """
+
+    def __init__(self, max_size=WORDS_CACHE_SIZE, ttl_seconds=WORDS_CACHE_TTL_SECONDS):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._words = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, language, sk):
+        with self._lock:
+            entry = self._words.get((language, sk))
+            if entry is None or entry[0] < time.monotonic():
+                self._words.pop((language, sk), None)
+                self.misses += 1
+                return None
+
+            self._words.move_to_end((language, sk))
+            self.hits += 1
+            return entry[1]
+
+    def put(self, language, sk, word):
+        with self._lock:
+            self._words[(language, sk)] = (time.monotonic() + self._ttl_seconds, word)
+            self._words.move_to_end((language, sk))
+            while len(self._words) > self._max_size:
+                self._words.popitem(last=False)
+
+    def put_items(self, items):
+        for item in items:
+            self.put(item["pk"]["S"].split("#")[-1], item["sk"]["S"], item["word"]["S"])
+
+    def stats(self):
+        """Hits and misses since the container started, and the cached words."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._words)}
+
+
+# Module level, so it survives across warm invocations
+words_cache = WordCache()
@@ -0,0 +1,124 @@
+"""Batched DynamoDB reads and writes."""
+
+import random
+import time
+
+# DynamoDB accepts at most 100 keys per BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 0.5
+
+
+def _key_id(key):
+    return tuple(sorted((name, value["S"]) for name, value in key.items()))
+
+
+def batch_get_items(
+    client, table_name, keys, projection_expression=None, time_budget_seconds=1.0
+):
+    """Read keys in chunks, retrying unprocessed keys within the time budget.
+
+    Repeated keys are read once. Returns the items found and the keys that
+    were still unprocessed when the time budget ran out.
+    """
+    deadline = time.monotonic() + time_budget_seconds
+    pending = list({_key_id(key): key for key in keys}.values())
+    items = []
+    attempt = 0
+
+    while pending:
+        unprocessed = []
+        for i in range(0, len(pending), BATCH_GET_MAX_KEYS):
+            request = {"Keys": pending[i : i + BATCH_GET_MAX_KEYS]}
+            if projection_expression:
+                request["ProjectionExpression"] = projection_expression
+
+            response = client.batch_get_item(RequestItems={table_name: request})
+            items += response["Responses"].get(table_name, [])
+            unprocessed += (
+                response.get("UnprocessedKeys", {}).get(table_name, {}).get("Keys", [])
+            )
+
+        pending = unprocessed
+        if not pending:
+            break
+
+        # Exponential backoff with full jitter, bounded by the time budget
+        delay = random.uniform(
+            0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+        )
+        if time.monotonic() + delay >= deadline:
+            break
+        time.sleep(delay)
+        attempt += 1
+
+    return items, pending
+
+
+# DynamoDB accepts at most 25 items per BatchWriteItem request
+BATCH_WRITE_MAX_ITEMS = 25
+
+
+class WriteRateLimiter:
+    """Token bucket that paces writes to the provisioned write capacity."""
+
+    def __init__(self, writes_per_second, burst=BATCH_WRITE_MAX_ITEMS):
+        self._rate = writes_per_second
+        self._burst = max(burst, 1)
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+
+    def acquire(self, count):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+            if self._tokens >= count:
+                self._tokens -= count
+                return
+            time.sleep((count - self._tokens) / self._rate)
+
+
+def batch_write_items(
+    client,
+    table_name,
+    items,
+    writes_per_second,
+    time_budget_seconds=60.0,
+    limiter=None,
+):
+    """Put items in chunks at the given write rate, retrying unprocessed items.
+
+    A limiter shared with other writers, such as a SharedRateLimiter, paces
+    the writes instead of a local one when given. Returns the put requests
+    that were still unprocessed when the time budget ran out.
+    """
+    deadline = time.monotonic() + time_budget_seconds
+    limiter = limiter or WriteRateLimiter(writes_per_second)
+    pending = [{"PutRequest": {"Item": item}} for item in items]
+    attempt = 0
+
+    while pending:
+        unprocessed = []
+        for i in range(0, len(pending), BATCH_WRITE_MAX_ITEMS):
+            chunk = pending[i : i + BATCH_WRITE_MAX_ITEMS]
+            limiter.acquire(len(chunk))
+            response = client.batch_write_item(RequestItems={table_name: chunk})
+            unprocessed += response.get("UnprocessedItems", {}).get(table_name, [])
+
+        pending = unprocessed
+        if not pending:
+            break
+
+        # Exponential backoff with full jitter, bounded by the time budget
+        delay = random.uniform(
+            0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+        )
+        if time.monotonic() + delay >= deadline:
+            break
+        time.sleep(delay)
+        attempt += 1
+
+    return pending
@@ -0,0 +1,49 @@
+"""Precomputed question decks."""
+
+import json
+import random
+
+from words_common.ddb import batch_get_items
+from words_common.questions import item_sizes, object_key, trasform_item
+
+DECK_SIZE = 5
+# Decks kept per language, rebuilt on a schedule and after every words
+# generation run
+DECK_POOL_SIZE = 20
+
+
+def deck_key(language, slot):
+    return {"pk": {"S": f"Deck#{language}"}, "sk": {"S": f"{slot:04d}"}}
+
+
+def deck_question(item):
+    """Transform a word item into a question with the audio key instead of a URL."""
+    question = trasform_item(item)
+    question.pop("word", None)
+    question["key"] = object_key(item)
+    # Lets the audio format be picked per request
+    question["sizes"] = item_sizes(item)
+    return question
+
+
+def read_decks(client, table_name, language, count=1):
+    """Return the questions of count random decks in one batched read.
+
+    Decks are shared, not consumed: every request picks from the same
+    DECK_POOL_SIZE decks until they are rebuilt, so questions repeat across
+    requests in between. Returns None when the decks don't hold
+    count * DECK_SIZE distinct questions, such as before the decks are built.
+    """
+    slots = random.sample(range(DECK_POOL_SIZE), min(count, DECK_POOL_SIZE))
+    items, _ = batch_get_items(
+        client, table_name, [deck_key(language, slot) for slot in slots]
+    )
+
+    questions = {}
+    for item in items:
+        for question in json.loads(item["questions"]["S"]):
+            questions.setdefault(question["id"], question)
+
+    if len(questions) < count * DECK_SIZE:
+        return None
+    return list(questions.values())[: count * DECK_SIZE]
@@ -0,0 +1,28 @@
+"""CloudWatch metrics in embedded metric format."""
+
+import json
+import time
+
+
+def put_metrics(namespace, dimensions, metrics):
+    """Publish count metrics from a log line, without a CloudWatch API call."""
+    print(
+        json.dumps(
+            {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": namespace,
+                            "Dimensions": [list(dimensions)],
+                            "Metrics": [
+                                {"Name": name, "Unit": "Count"} for name in metrics
+                            ],
+                        }
+                    ],
+                },
+                **dimensions,
+                **metrics,
+            }
+        )
+    )
@@ -0,0 +1,58 @@
+"""Warm-container cache of presigned S3 URLs."""
+
+import threading
+import time
+from collections import OrderedDict
+
+PRESIGNED_URL_CACHE_SIZE = 5000
+# URLs issued within the same window share their expiry, so an object keeps
+# the same URL for the rest of the window and clients can cache its audio
+PRESIGNED_URL_WINDOW_SECONDS = 300
+
+
+class PresignedUrlCache:
+    """Size-bounded LRU cache of presigned GetObject URLs keyed by S3 object."""
+
+    def __init__(
+        self,
+        max_size=PRESIGNED_URL_CACHE_SIZE,
+        window_seconds=PRESIGNED_URL_WINDOW_SECONDS,
+    ):
+        self._max_size = max_size
+        self._window_seconds = window_seconds
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def url(self, s3_client, bucket_name, key, min_remaining_seconds):
+        """Return a URL for the object that stays valid for min_remaining_seconds."""
+        now = time.time()
+        with self._lock:
+            entry = self._urls.get((bucket_name, key))
+            if entry and entry[0] - now >= min_remaining_seconds:
+                self._urls.move_to_end((bucket_name, key))
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Expire min_remaining_seconds after the end of the current window
+        window_end = (now // self._window_seconds + 1) * self._window_seconds
+        expires_at = window_end + min_remaining_seconds
+        url = s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket_name, "Key": key},
+            ExpiresIn=int(expires_at - now),
+        )
+
+        with self._lock:
+            self._urls[(bucket_name, key)] = (expires_at, url)
+            self._urls.move_to_end((bucket_name, key))
+            while len(self._urls) > self._max_size:
+                self._urls.popitem(last=False)
+
+        return url
+
+
+# Module level, so it survives across warm invocations
+presigned_url_cache = PresignedUrlCache()
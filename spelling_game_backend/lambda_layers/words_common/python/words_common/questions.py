@@ -0,0 +1,98 @@
+"""Transform word items into questions."""
+
+from words_common.audio import (
+    AUDIO_PREFIX,
+    DEFAULT_AUDIO_FORMAT,
+    audio_key,
+    choose_format,
+    s3file_key,
+)
+from words_common.presign import presigned_url_cache
+
+PRESIGNED_URL_EXPIRATION_SECONDS = 120
+
+
+def trasform_item(item):
+    return {
+        "id": item["sk"]["S"],
+        "description": item["description"]["S"],
+        "charcount": item["charcount"]["N"],
+        "language": item["pk"]["S"].split("#")[-1],
+        "word": item["word"]["S"],
+    }
+
+
+def item_sizes(item):
+    """Audio sizes in bytes by format, of the formats stored for the word."""
+    return {
+        audio_format: int(size["N"])
+        for audio_format, size in item.get("sizes", {}).get("M", {}).items()
+    }
+
+
+def content_key(item, audio_format=DEFAULT_AUDIO_FORMAT):
+    return audio_key(item["pk"]["S"].split("#")[-1], item["sk"]["S"], audio_format)
+
+
+def legacy_key(item):
+    """Original mp3 key of a word whose s3file still points outside the audio prefix.
+
+    The backfill points s3file at the content-addressed key only after the
+    audio of every word was copied there.
+    """
+    if "s3file" not in item:
+        return None
+    key = s3file_key(item["s3file"]["S"])
+    return None if key.startswith(AUDIO_PREFIX) else key
+
+
+def object_key(item, audio_format=DEFAULT_AUDIO_FORMAT):
+    """Key the word's audio is served from, its original one until migrated."""
+    return legacy_key(item) or content_key(item, audio_format)
+
+
+def presign_item(
+    s3_client,
+    bucket_name,
+    item,
+    expiration=PRESIGNED_URL_EXPIRATION_SECONDS,
+    formats=(DEFAULT_AUDIO_FORMAT,),
+):
+    audio_format = choose_format(item_sizes(item), formats)
+    presigned_url = presigned_url_cache.url(
+        s3_client, bucket_name, object_key(item, audio_format), expiration
+    )
+
+    question = trasform_item(item)
+    question["url"] = presigned_url
+    question["format"] = audio_format
+    # Read by audio bundles, removed before the questions are returned
+    question["key"] = object_key(item)
+
+    return question
+
+
+def audio_path_item(item, formats=(DEFAULT_AUDIO_FORMAT,)):
+    """Transform a word item into a question with the CloudFront audio path."""
+    audio_format = choose_format(item_sizes(item), formats)
+    question = trasform_item(item)
+    question["url"] = f"/{object_key(item, audio_format)}"
+    question["format"] = audio_format
+    question["key"] = object_key(item)
+
+    return question
+
+
+def unique_questions(questions):
+    unique_results = []
+    seen_words = set()
+
+    for item in questions:
+        if "word" in item:
+            word = item["word"].lower()
+            if word not in seen_words:
+                item.pop("word", None)
+                unique_results.append(item)
+                seen_words.add(word)
+
+    return unique_results
@@ -0,0 +1,80 @@
+"""Token bucket shared by all functions through a DynamoDB item."""
+
+import random
+import threading
+import time
+
+from botocore.exceptions import ClientError
+
+
+def rate_limit_key(name):
+    return {"pk": {"S": f"RateLimit#{name}"}, "sk": {"S": "Bucket"}}
+
+
+class SharedRateLimiter:
+    """Token bucket whose state is kept in a DynamoDB item.
+
+    Every function and execution using the same name draws from the same
+    bucket, so their combined rate stays within rate_per_second. Only the
+    tokens a caller needs are claimed, so none are held back from the other
+    writers. Safe to use from several threads.
+    """
+
+    def __init__(self, client, table_name, name, rate_per_second, burst=None):
+        self._client = client
+        self._table_name = table_name
+        self._key = rate_limit_key(name)
+        self._rate = float(rate_per_second)
+        self._burst = max(int(burst or rate_per_second), 1)
+        self._lock = threading.Lock()
+
+    def acquire(self, count=1):
+        """Block until count tokens are taken from the bucket."""
+        with self._lock:
+            # The bucket never holds more than its burst size
+            while count > 0:
+                count -= self._claim(min(count, self._burst))
+
+    def _claim(self, count):
+        """Take count tokens from the table, waiting for them to refill."""
+        while True:
+            item = self._client.get_item(
+                TableName=self._table_name, Key=self._key, ConsistentRead=True
+            ).get("Item")
+            now = time.time()
+
+            if item:
+                updated_at = item["updated_at"]["N"]
+                elapsed = max(now - float(updated_at), 0)
+                tokens = min(
+                    self._burst, float(item["tokens"]["N"]) + elapsed * self._rate
+                )
+                condition = "updated_at = :updated_at"
+                values = {":updated_at": {"N": updated_at}}
+            else:
+                tokens = self._burst
+                condition = "attribute_not_exists(pk)"
+                values = {}
+
+            if tokens < count:
+                time.sleep((count - tokens) / self._rate)
+                continue
+
+            try:
+                self._client.update_item(
+                    TableName=self._table_name,
+                    Key=self._key,
+                    UpdateExpression="SET tokens = :tokens, updated_at = :now",
+                    ConditionExpression=condition,
+                    ExpressionAttributeValues={
+                        ":tokens": {"N": repr(tokens - count)},
+                        ":now": {"N": repr(now)},
+                        **values,
+                    },
+                )
+                return count
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                # Another function claimed tokens in the meantime
+                time.sleep(random.uniform(0, 1 / self._rate))
@@ -0,0 +1,174 @@
+"""Uniform random sampling of words through their slot numbers."""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Rounds of fresh random slots before falling back to a sequential walk. Slots
+# are only left empty by words saved twice, so a round rarely misses.
+MAX_ATTEMPTS = 3
+# Parallel queries when sampling several rounds of words at once
+MAX_QUERY_CONCURRENCY = 20
+# Words saved within this time may not be sampled yet by a warm container
+SLOT_COUNT_TTL_SECONDS = 60
+
+_slot_counts = {}
+_slot_counts_lock = threading.Lock()
+
+
+def stats_key(language):
+    return {"pk": {"S": f"Stats#{language}"}, "sk": {"S": "Pool"}}
+
+
+def reserve_slots(client, table_name, language, count):
+    """Reserve count consecutive slots of the language, returning the first.
+
+    Every saved word gets the next free slot, so the slots of a language are
+    numbered densely from 0 and a uniformly random slot is a uniformly
+    random word.
+    """
+    response = client.update_item(
+        TableName=table_name,
+        Key=stats_key(language),
+        UpdateExpression="ADD slot_count :count",
+        ExpressionAttributeValues={":count": {"N": str(count)}},
+        ReturnValues="UPDATED_NEW",
+    )
+    return int(response["Attributes"]["slot_count"]["N"]) - count
+
+
+def slot_count(client, table_name, language):
+    """Number of slots reserved for the language, cached for a short time."""
+    with _slot_counts_lock:
+        cached = _slot_counts.get(language)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    item = client.get_item(
+        TableName=table_name,
+        Key=stats_key(language),
+        ProjectionExpression="slot_count",
+    ).get("Item", {})
+    count = int(item["slot_count"]["N"]) if "slot_count" in item else 0
+
+    with _slot_counts_lock:
+        _slot_counts[language] = (time.monotonic() + SLOT_COUNT_TTL_SECONDS, count)
+    return count
+
+
+def _query(client, table_name, index_name, language, key_condition, values, limit):
+    kwargs = {"IndexName": index_name} if index_name else {}
+    response = client.query(
+        TableName=table_name,
+        KeyConditionExpression=key_condition,
+        ExpressionAttributeValues={":pk": {"S": f"Word#{language}"}, **values},
+        Limit=limit,
+        **kwargs,
+    )
+    return response["Items"]
+
+
+def _query_slot(client, table_name, index_name, language, slot):
+    return _query(
+        client,
+        table_name,
+        index_name,
+        language,
+        "pk = :pk AND slot = :slot",
+        {":slot": {"N": str(slot)}},
+        1,
+    )
+
+
+def _query_from(client, table_name, index_name, language, limit, key_condition, start):
+    items = _query(
+        client, table_name, index_name, language, key_condition, start, limit
+    )
+    if len(items) < limit:
+        # Wrap around when the walk passes the last key
+        items += _query(client, table_name, index_name, language, "pk = :pk", {}, limit)
+    return items
+
+
+def _random_slots(size, count, tried):
+    """Return up to count distinct random slots below size, none of them tried."""
+    slots = set()
+    while len(slots) < count and len(tried) + len(slots) < size:
+        slot = random.randrange(size)
+        if slot not in tried:
+            slots.add(slot)
+    return slots
+
+
+def sample_words(client, table_name, index_name, language, count):
+    """Sample count distinct words, or every word when the pool is smaller.
+
+    Every word is equally likely: slots are drawn uniformly without
+    replacement, and an empty slot is drawn again instead of being replaced
+    by a neighbouring word.
+    """
+    size = slot_count(client, table_name, language)
+    sampled = {}
+    tried = set()
+
+    def add(item):
+        word = item["word"]["S"].lower()
+        if word in sampled or len(sampled) >= count:
+            return
+        sampled[word] = item
+
+    for _ in range(MAX_ATTEMPTS):
+        slots = _random_slots(size, count - len(sampled), tried)
+        if not slots:
+            break
+        tried |= slots
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(slots), MAX_QUERY_CONCURRENCY)
+        ) as executor:
+            results = executor.map(
+                lambda slot: _query_slot(
+                    client, table_name, index_name, language, slot
+                ),
+                slots,
+            )
+
+        for items in results:
+            for item in items:
+                add(item)
+
+    missing = count - len(sampled)
+    if missing > 0 and size > 0:
+        # Consecutive slots from a random one are distinct words, which fills
+        # the set whenever the pool holds enough of them
+        for item in _query_from(
+            client,
+            table_name,
+            index_name,
+            language,
+            count + len(sampled),
+            "pk = :pk AND slot >= :slot",
+            {":slot": {"N": str(random.randrange(size))}},
+        ):
+            add(item)
+
+    missing = count - len(sampled)
+    if missing > 0:
+        # Words saved before sampling by slot have none until the backfill
+        # reaches them, so a short set is filled from the table itself. Word
+        # ids are MD5 hashes, so a random one is a random place to start.
+        for item in _query_from(
+            client,
+            table_name,
+            None,
+            language,
+            count + len(sampled),
+            "pk = :pk AND sk >= :sk",
+            {":sk": {"S": f"{random.getrandbits(128):032x}"}},
+        ):
+            add(item)
+
+    items = list(sampled.values())
+    random.shuffle(items)
+    return items
@@ -0,0 +1,95 @@
+"""CloudFront signed cookies."""
+
+import base64
+import datetime
+import threading
+import time
+from email.utils import formatdate
+
+import rsa
+from botocore.signers import CloudFrontSigner
+from pyasn1.codec.der import decoder
+
+# Cookies issued within the same window are identical
+SIGNED_COOKIES_WINDOW_SECONDS = 300
+
+
+def load_private_key(pem):
+    """Load a PEM RSA private key.
+
+    Both PKCS#1 ("RSA PRIVATE KEY") and unencrypted PKCS#8 ("PRIVATE KEY")
+    keys are accepted.
+    """
+    if "BEGIN RSA PRIVATE KEY" in pem:
+        return rsa.PrivateKey.load_pkcs1(pem.encode("ascii"))
+
+    # PKCS#8 wraps the PKCS#1 key in an octet string after the algorithm
+    der = base64.b64decode(
+        "".join(line for line in pem.strip().splitlines() if "-----" not in line)
+    )
+    private_key_info, _ = decoder.decode(der)
+    return rsa.PrivateKey.load_pkcs1(bytes(private_key_info[2]), "DER")
+
+
+def _cloudfront_b64(data):
+    return (
+        base64.b64encode(data)
+        .decode("ascii")
+        .replace("+", "-")
+        .replace("=", "_")
+        .replace("/", "~")
+    )
+
+
+class SignedCookies:
+    """Signed cookies granting access to every object under a path.
+
+    The cookies of a window are signed once and reused by every response
+    of the window. They stay valid for lifetime_seconds after its end.
+    """
+
+    def __init__(
+        self,
+        key_pair_id,
+        private_key,
+        path,
+        lifetime_seconds,
+        window_seconds=SIGNED_COOKIES_WINDOW_SECONDS,
+    ):
+        self._key_pair_id = key_pair_id
+        # CloudFront only accepts RSA signatures over SHA-1
+        self._signer = CloudFrontSigner(
+            key_pair_id, lambda message: rsa.sign(message, private_key, "SHA-1")
+        )
+        self._path = path
+        self._lifetime_seconds = lifetime_seconds
+        self._window_seconds = window_seconds
+        self._cached = None
+        self._lock = threading.Lock()
+
+    def headers(self):
+        """Set-Cookie header values for the current window."""
+        window = int(time.time() // self._window_seconds)
+        with self._lock:
+            if self._cached and self._cached[0] == window:
+                return self._cached[1]
+
+        expires_at = (window + 1) * self._window_seconds + self._lifetime_seconds
+        policy = self._signer.build_policy(
+            f"https://*{self._path}*",
+            datetime.datetime.fromtimestamp(expires_at, datetime.timezone.utc),
+        ).encode("utf-8")
+        cookies = {
+            "CloudFront-Policy": _cloudfront_b64(policy),
+            "CloudFront-Signature": _cloudfront_b64(self._signer.rsa_signer(policy)),
+            "CloudFront-Key-Pair-Id": self._key_pair_id,
+        }
+        expires = formatdate(expires_at, usegmt=True)
+        headers = [
+            f"{name}={value}; Path={self._path}; Expires={expires}; Secure; HttpOnly; SameSite=Strict"
+            for name, value in cookies.items()
+        ]
+
+        with self._lock:
+            self._cached = (window, headers)
+        return headers
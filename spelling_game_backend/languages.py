@@ -0,0 +1,64 @@
+"""Registry of the languages words are generated and served in."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Language:
+    """A language words are generated in."""
+
+    code: str
+    prompt_name: str
+    voice_id: str
+    engine: str
+    # Folder asynchronous synthesis tasks write to before the audio is moved
+    # to its content-addressed key
+    output_prefix: str
+    # Letters a generated word may consist of
+    alphabet: str
+    synthesis_concurrency: int = 4
+
+    def __post_init__(self):
+        # Polly names the task output after the last "/" of the prefix
+        if not self.output_prefix.endswith("/"):
+            raise ValueError(f"Output prefix of {self.code} must end with /")
+
+    def to_input(self) -> dict:
+        """State machine input for generating words in this language."""
+        return {
+            "language": self.code,
+            "languageName": self.prompt_name,
+            "voiceId": self.voice_id,
+            "engine": self.engine,
+            "outputPrefix": self.output_prefix,
+            "alphabet": self.alphabet,
+            "synthesisConcurrency": self.synthesis_concurrency,
+        }
+
+
+LANGUAGES = (
+    Language(
+        code="nl-NL",
+        prompt_name="Dutch",
+        voice_id="Ruben",
+        engine="standard",
+        output_prefix="nl-NL/",
+        alphabet="abcdefghijklmnopqrstuvwxyzáäéëèíïóöúü",
+    ),
+    Language(
+        code="en-US",
+        prompt_name="English",
+        voice_id="Matthew",
+        engine="standard",
+        output_prefix="en-US/",
+        alphabet="abcdefghijklmnopqrstuvwxyz",
+    ),
+)
+
+# Languages generated at the same time in a single generation run
+MAX_PARALLEL_LANGUAGES = 4
+
+
+def language_codes() -> list:
+    """Codes of all registered languages."""
+    return [language.code for language in LANGUAGES]
@@ -29,7 +29,12 @@ class SpellingGameBackendStack(Stack):
             "WordsBackendStack",
             params=WordsBackendStackParams(
                 s3_bucket=self.words_generator_stack.words_generator_storage.words_storage_s3_bucket,
+                words_generator_state_machine=self.words_generator_stack.words_generator_state_machine.word_generator_state_machine,
+                common_layer=self.words_generator_stack.words_common_layer.words_common_layer,
                 dynamodb_table=self.words_generator_stack.words_generator_storage.words_storage_dynamodb_table,
+                sampling_index_name=self.words_generator_stack.words_generator_storage.words_sampling_index_name,
+                rate_limit_table=self.words_generator_stack.words_generator_storage.rate_limit_dynamodb_table,
+                write_capacity=self.words_generator_stack.words_generator_storage.words_storage_write_capacity,
             ),
         )
 
@@ -39,5 +44,11 @@ class SpellingGameBackendStack(Stack):
             params=HostingResourcesStackParams(
                 rest_api=self.words_backend_stack.words_backend_api.words_backend_api,
                 ssm_parameter=self.words_backend_stack.backend_api_lambda_functions.apigw_custom_header_parameter,
+                s3_bucket=self.words_generator_stack.words_generator_storage.words_storage_s3_bucket,
+                audio_key_group=(
+                    self.words_backend_stack.audio_signing_keys.key_group
+                    if self.words_backend_stack.audio_signing_keys
+                    else None
+                ),
             ),
         )
@@ -1,6 +1,7 @@
 """Hosting resources nested stack."""
 
 from dataclasses import dataclass
+from typing import Optional
 from aws_cdk import (
     Duration,
     Stack,
@@ -25,6 +26,8 @@ class HostingResourcesStackParams:
 
     rest_api: apigateway.RestApi
     ssm_parameter: ssm.StringParameter
+    s3_bucket: s3.Bucket
+    audio_key_group: Optional[cloudfront.KeyGroup] = None
 
 
 class HostingResourcesStack(NestedStack):
@@ -83,6 +86,41 @@ class HostingResourcesStack(NestedStack):
             cache_policy=cloudfront.CachePolicy.CACHING_DISABLED,
         )
 
+        # Word audio, readable with the signed cookies set by /questions. The
+        # bucket belongs to the words generator stack, so it is imported and
+        # its policy, its only one, is managed here where the distribution
+        # ARN is known.
+        if params.audio_key_group:
+            words_storage_bucket = s3.Bucket.from_bucket_name(
+                self, "WordsStorageBucket", params.s3_bucket.bucket_name
+            )
+            self.cloudfront_distribution.add_behavior(
+                path_pattern="/audio/*",
+                origin=origins.S3BucketOrigin.with_origin_access_control(
+                    words_storage_bucket
+                ),
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.HTTPS_ONLY,
+                cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
+                trusted_key_groups=[params.audio_key_group],
+            )
+
+            words_storage_bucket_policy = s3.BucketPolicy(
+                self, "WordsStorageBucketPolicy", bucket=words_storage_bucket
+            )
+            words_storage_bucket_policy.document.add_statements(
+                iam.PolicyStatement(
+                    principals=[iam.ServicePrincipal("cloudfront.amazonaws.com")],
+                    actions=["s3:GetObject"],
+                    resources=[words_storage_bucket.arn_for_objects("audio/*")],
+                    conditions={
+                        "StringEquals": {
+                            "AWS:SourceArn": self.cloudfront_distribution.distribution_arn
+                        }
+                    },
+                )
+            )
+
         # Update cloudfront distribution with the custom header
         update_secure_header = _lambda.Function(
             self,
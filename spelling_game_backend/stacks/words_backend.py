@@ -1,6 +1,7 @@
 """Words backend nested stack."""
 
 from dataclasses import dataclass
+from typing import Optional
 from aws_cdk import (
     CfnOutput,
     Stack,
@@ -8,6 +9,8 @@ from aws_cdk import (
     aws_sns as sns,
     aws_s3 as s3,
     aws_dynamodb as ddb,
+    aws_stepfunctions as sfn,
+    aws_lambda as _lambda,
 )
 
 from spelling_game_backend.constructs.words_backend_state_machine import (
@@ -26,6 +29,12 @@ from spelling_game_backend.constructs.backend_api_lambdas import (
     BackendApiLambdaFunctions,
     BackendApiLambdaFunctionsParams,
 )
+from spelling_game_backend.constructs.words_decks_materializer import (
+    WordsDecksMaterializer,
+    WordsDecksMaterializerParams,
+)
+from spelling_game_backend.constructs.audio_signing_keys import AudioSigningKeys
+from config import BaseConfig
 
 
 @dataclass
@@ -33,7 +42,12 @@ class WordsBackendStackParams:
     """Parameters for the WordsBackendStack."""
 
     dynamodb_table: ddb.Table
+    sampling_index_name: str
     s3_bucket: s3.Bucket
+    words_generator_state_machine: sfn.StateMachine
+    common_layer: _lambda.LayerVersion
+    rate_limit_table: ddb.Table
+    write_capacity: int
 
 
 class WordsBackendStack(NestedStack):
@@ -52,12 +66,20 @@ class WordsBackendStack(NestedStack):
             topic_name="WordsBackendNotificationSNS",
         )
 
+        # Word audio is served through CloudFront with signed cookies
+        self.audio_signing_keys: Optional[AudioSigningKeys] = (
+            AudioSigningKeys(self, "AudioSigningKeys")
+            if BaseConfig().audio_delivery == "cloudfront"
+            else None
+        )
+
         self.words_backend_lambda_functions = WordsBackendLambdaFunctions(
             self,
             "WordsBackendLambdaFunctions",
             params=WordsBackendLambdaFunctionsParams(
                 s3_bucket=params.s3_bucket,
                 dynamodb_table=params.dynamodb_table,
+                common_layer=params.common_layer,
             ),
         )
 
@@ -68,17 +90,40 @@ class WordsBackendStack(NestedStack):
                 s3_bucket=params.s3_bucket,
                 dynamodb_table=params.dynamodb_table,
                 sns_topic=self.notification_sns_topic,
+                sampling_index_name=params.sampling_index_name,
                 presigned_url_lambda=self.words_backend_lambda_functions.presigned_url_lambda,
                 get_unique_results_lambda=self.words_backend_lambda_functions.get_unique_results_lambda,
             ),
         )
 
+        # Decks are only read when questions are served from them
+        self.words_decks_materializer: Optional[WordsDecksMaterializer] = (
+            WordsDecksMaterializer(
+                self,
+                "WordsDecksMaterializer",
+                params=WordsDecksMaterializerParams(
+                    dynamodb_table=params.dynamodb_table,
+                    sampling_index_name=params.sampling_index_name,
+                    common_layer=params.common_layer,
+                    words_generator_state_machine=params.words_generator_state_machine,
+                    rate_limit_table=params.rate_limit_table,
+                    write_capacity=params.write_capacity,
+                ),
+            )
+            if BaseConfig().questions_mode == "deck"
+            else None
+        )
+
         self.backend_api_lambda_functions = BackendApiLambdaFunctions(
             self,
             "BackendApiLambdaFunctions",
             params=BackendApiLambdaFunctionsParams(
                 dynamodb_table=params.dynamodb_table,
+                sampling_index_name=params.sampling_index_name,
+                s3_bucket=params.s3_bucket,
                 state_machine=self.words_backend_state_machine.words_backend_state_machine,
+                common_layer=params.common_layer,
+                audio_signing_keys=self.audio_signing_keys,
             ),
         )
 
@@ -6,9 +6,14 @@ from aws_cdk import (
     aws_sns as sns,
 )
 
+from spelling_game_backend.constructs.words_common_layer import WordsCommonLayer
 from spelling_game_backend.constructs.words_generator_storage import (
     WordsGeneratorStorage,
 )
+from spelling_game_backend.constructs.words_generator_lambdas import (
+    WordsGeneratorLambdaFunctions,
+    WordsGeneratorLambdaFunctionsParams,
+)
 from spelling_game_backend.constructs.words_generator_state_machine import (
     WordsGeneratorStateMachine,
     WordsGeneratorStateMachineParams,
@@ -17,6 +22,10 @@ from spelling_game_backend.constructs.words_generator_scheduler import (
     WordsGeneratorScheduler,
     WordsGeneratorSchedulerParams,
 )
+from spelling_game_backend.constructs.words_storage_migrations import (
+    WordsStorageMigrations,
+    WordsStorageMigrationsParams,
+)
 
 
 class WordsGeneratorStack(NestedStack):
@@ -37,6 +46,30 @@ class WordsGeneratorStack(NestedStack):
             self, "WordsGeneratorStorage"
         )
 
+        self.words_common_layer = WordsCommonLayer(self, "WordsCommonLayer")
+
+        self.words_storage_migrations = WordsStorageMigrations(
+            self,
+            "WordsStorageMigrations",
+            params=WordsStorageMigrationsParams(
+                dynamodb_table=self.words_generator_storage.words_storage_dynamodb_table,
+                s3_bucket=self.words_generator_storage.words_storage_s3_bucket,
+                common_layer=self.words_common_layer.words_common_layer,
+            ),
+        )
+
+        self.words_generator_lambda_functions = WordsGeneratorLambdaFunctions(
+            self,
+            "WordsGeneratorLambdaFunctions",
+            params=WordsGeneratorLambdaFunctionsParams(
+                s3_bucket=self.words_generator_storage.words_storage_s3_bucket,
+                dynamodb_table=self.words_generator_storage.words_storage_dynamodb_table,
+                rate_limit_table=self.words_generator_storage.rate_limit_dynamodb_table,
+                common_layer=self.words_common_layer.words_common_layer,
+                write_capacity=self.words_generator_storage.words_storage_write_capacity,
+            ),
+        )
+
         self.words_generator_state_machine = WordsGeneratorStateMachine(
             self,
             "WordsGeneratorStateMachine",
@@ -44,6 +77,11 @@ class WordsGeneratorStack(NestedStack):
                 s3_bucket=self.words_generator_storage.words_storage_s3_bucket,
                 dynamodb_table=self.words_generator_storage.words_storage_dynamodb_table,
                 sns_topic=self.notification_sns,
+                synthesis_task_sns_topic=self.words_generator_lambda_functions.synthesis_task_sns_topic,
+                synthesis_task_callback_lambda=self.words_generator_lambda_functions.synthesis_task_callback_lambda,
+                synthesize_words_lambda=self.words_generator_lambda_functions.synthesize_words_lambda,
+                prepare_generated_words_lambda=self.words_generator_lambda_functions.prepare_generated_words_lambda,
+                persist_words_lambda=self.words_generator_lambda_functions.persist_words_lambda,
             ),
         )
 
@@ -52,5 +90,7 @@ class WordsGeneratorStack(NestedStack):
             "WordsGeneratorScheduler",
             params=WordsGeneratorSchedulerParams(
                 state_machine=self.words_generator_state_machine.word_generator_state_machine,
+                dynamodb_table=self.words_generator_storage.words_storage_dynamodb_table,
+                common_layer=self.words_common_layer.words_common_layer,
             ),
         )
@@ -0,0 +1,36 @@
+import importlib.util
+import os
+import sys
+
+# Lambda functions import the shared code from the words_common layer
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "spelling_game_backend",
+        "lambda_layers",
+        "words_common",
+        "python",
+    ),
+)
+
+LAMBDA_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "spelling_game_backend", "lambda"
+)
+
+
+def load_lambda(name, environment):
+    """Import the handler module of a Lambda function with its environment set.
+
+    Clients created at import never call AWS, so a region is all they need.
+    """
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-west-1")
+    os.environ.update(environment)
+    spec = importlib.util.spec_from_file_location(
+        f"{name}_index", os.path.join(LAMBDA_DIR, name, "index.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
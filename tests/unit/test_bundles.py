@@ -0,0 +1,96 @@
+import base64
+import io
+
+import pytest
+
+from words_common import bundles
+
+# MPEG-1 layer III, 128 kbps, 44.1 kHz: 417 bytes, or 418 with padding
+MPEG1_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+MPEG1_PADDED_HEADER = bytes([0xFF, 0xFB, 0x92, 0x00])
+# MPEG-2 layer III, 64 kbps, 22.05 kHz: 208 bytes
+MPEG2_HEADER = bytes([0xFF, 0xF3, 0x80, 0x00])
+MPEG1_FRAME_MS = 1152 / 44100 * 1000
+MPEG2_FRAME_MS = 576 / 22050 * 1000
+
+
+def frame(header, length):
+    return header + bytes(length - len(header))
+
+
+def id3_tag(size):
+    # The size is syncsafe, seven bits per byte. The tag body holds a frame
+    # header that must not be counted.
+    return (
+        b"ID3\x04\x00\x00"
+        + bytes([0, 0, size >> 7, size & 0x7F])
+        + MPEG1_HEADER
+        + bytes(size - 4)
+    )
+
+
+@pytest.mark.parametrize(
+    "data, expected_ms",
+    [
+        (frame(MPEG1_HEADER, 417) * 10, 10 * MPEG1_FRAME_MS),
+        (
+            frame(MPEG1_PADDED_HEADER, 418) + frame(MPEG1_HEADER, 417),
+            2 * MPEG1_FRAME_MS,
+        ),
+        (frame(MPEG2_HEADER, 208) * 4, 4 * MPEG2_FRAME_MS),
+        (id3_tag(300) + frame(MPEG1_HEADER, 417) * 3, 3 * MPEG1_FRAME_MS),
+        # Garbage before the first frame is skipped
+        (b"\x00\x01\x02" + frame(MPEG1_HEADER, 417), MPEG1_FRAME_MS),
+        # A truncated last frame isn't counted
+        (frame(MPEG1_HEADER, 417) * 2 + frame(MPEG1_HEADER, 100), 2 * MPEG1_FRAME_MS),
+        (b"", 0),
+    ],
+)
+def test_mp3_duration_ms(data, expected_ms):
+    assert bundles.mp3_duration_ms(data) == int(expected_ms)
+
+
+class StubS3:
+    def __init__(self, objects):
+        self.objects = objects
+        self.put = {}
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.put[Key] = kwargs
+
+
+def test_bundle_audio_indexes_every_clip():
+    clips = {
+        "a.mp3": frame(MPEG1_HEADER, 417) * 2,
+        "b.mp3": id3_tag(100) + frame(MPEG2_HEADER, 208),
+        "c.mp3": frame(MPEG1_HEADER, 417),
+    }
+    questions = [{"id": key} for key in clips]
+
+    bundle = bundles.bundle_audio(StubS3(clips), "bucket", questions, list(clips))
+
+    assert bundle == b"".join(clips.values())
+    assert [question["audio"] for question in questions] == [
+        {"offset": 0, "length": 834, "duration": int(2 * MPEG1_FRAME_MS)},
+        {"offset": 834, "length": 318, "duration": int(MPEG2_FRAME_MS)},
+        {"offset": 1152, "length": 417, "duration": int(MPEG1_FRAME_MS)},
+    ]
+    for question in questions:
+        offset, length = question["audio"]["offset"], question["audio"]["length"]
+        assert bundle[offset : offset + length] == clips[question["id"]]
+
+
+def test_inline_bundle():
+    assert base64.b64decode(bundles.inline_bundle(b"mp3")["data"]) == b"mp3"
+
+
+def test_saved_bundles_are_cached_no_longer_than_they_exist():
+    s3 = StubS3({})
+
+    key = bundles.save_bundle(s3, "bucket", b"mp3")
+
+    assert key.startswith(bundles.BUNDLE_PREFIX)
+    assert s3.put[key]["CacheControl"] == "public, max-age=86400"
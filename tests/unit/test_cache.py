@@ -0,0 +1,38 @@
+from words_common import cache
+
+
+def word_item(sk, word):
+    return {"pk": {"S": "Word#nl-NL"}, "sk": {"S": sk}, "word": {"S": word}}
+
+
+def test_hits_and_misses_are_counted():
+    words = cache.WordCache()
+    words.put_items([word_item("a", "appel")])
+
+    assert words.get("nl-NL", "a") == "appel"
+    assert words.get("nl-NL", "b") is None
+    assert words.get("en-US", "a") is None
+    assert words.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_least_recently_used_word_is_evicted():
+    words = cache.WordCache(max_size=2)
+    words.put("nl-NL", "a", "appel")
+    words.put("nl-NL", "b", "peer")
+    words.get("nl-NL", "a")
+    words.put("nl-NL", "c", "kers")
+
+    assert words.get("nl-NL", "b") is None
+    assert words.get("nl-NL", "a") == "appel"
+    assert words.get("nl-NL", "c") == "kers"
+
+
+def test_expired_words_are_misses(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    words = cache.WordCache(ttl_seconds=10)
+    words.put("nl-NL", "a", "appel")
+
+    now[0] = 111.0
+    assert words.get("nl-NL", "a") is None
+    assert words.stats()["size"] == 0
@@ -0,0 +1,188 @@
+import pytest
+
+from words_common import ddb
+
+TABLE_NAME = "words"
+
+
+def word_key(index):
+    return {"pk": {"S": "Word#nl-NL"}, "sk": {"S": f"id{index}"}}
+
+
+class ThrottledDynamoDB:
+    """Stub client leaving part of every batch unprocessed, like a throttled table."""
+
+    def __init__(self, unprocessed_per_call=0, throttled_calls=None):
+        self.unprocessed_per_call = unprocessed_per_call
+        self.throttled_calls = throttled_calls
+        self.get_requests = []
+        self.write_requests = []
+        self.written = []
+
+    def _throttled(self, calls):
+        return self.throttled_calls is None or len(calls) <= self.throttled_calls
+
+    def batch_get_item(self, RequestItems):
+        request = RequestItems[TABLE_NAME]
+        self.get_requests.append(request)
+        keys = request["Keys"]
+        unprocessed = (
+            keys[: self.unprocessed_per_call]
+            if self._throttled(self.get_requests)
+            else []
+        )
+        response = {
+            "Responses": {
+                TABLE_NAME: [dict(key) for key in keys if key not in unprocessed]
+            }
+        }
+        if unprocessed:
+            response["UnprocessedKeys"] = {TABLE_NAME: {"Keys": unprocessed}}
+        return response
+
+    def batch_write_item(self, RequestItems):
+        chunk = RequestItems[TABLE_NAME]
+        self.write_requests.append(chunk)
+        unprocessed = (
+            chunk[: self.unprocessed_per_call]
+            if self._throttled(self.write_requests)
+            else []
+        )
+        self.written += [
+            request["PutRequest"]["Item"]
+            for request in chunk
+            if request not in unprocessed
+        ]
+        response = {}
+        if unprocessed:
+            response["UnprocessedItems"] = {TABLE_NAME: unprocessed}
+        return response
+
+
+class UnlimitedRate:
+    def acquire(self, count):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(ddb.time, "sleep", lambda seconds: None)
+
+
+def test_batch_get_items_reads_in_chunks_of_100():
+    client = ThrottledDynamoDB()
+
+    items, unprocessed = ddb.batch_get_items(
+        client, TABLE_NAME, [word_key(i) for i in range(250)]
+    )
+
+    assert [len(request["Keys"]) for request in client.get_requests] == [100, 100, 50]
+    assert len(items) == 250
+    assert unprocessed == []
+
+
+def test_batch_get_items_reads_repeated_keys_once():
+    client = ThrottledDynamoDB()
+
+    items, _ = ddb.batch_get_items(
+        client, TABLE_NAME, [word_key(i % 3) for i in range(9)]
+    )
+
+    assert len(client.get_requests[0]["Keys"]) == 3
+    assert len(items) == 3
+
+
+def test_batch_get_items_retries_unprocessed_keys():
+    client = ThrottledDynamoDB(unprocessed_per_call=10, throttled_calls=3)
+
+    items, unprocessed = ddb.batch_get_items(
+        client, TABLE_NAME, [word_key(i) for i in range(120)], "pk, sk, word"
+    )
+
+    assert sorted(item["sk"]["S"] for item in items) == sorted(
+        f"id{i}" for i in range(120)
+    )
+    assert unprocessed == []
+    # Only the unprocessed keys are read again
+    assert [len(request["Keys"]) for request in client.get_requests] == [
+        100,
+        20,
+        20,
+        10,
+    ]
+    assert all(
+        request["ProjectionExpression"] == "pk, sk, word"
+        for request in client.get_requests
+    )
+
+
+def test_batch_get_items_returns_unprocessed_keys_after_the_time_budget():
+    client = ThrottledDynamoDB(unprocessed_per_call=5)
+
+    items, unprocessed = ddb.batch_get_items(
+        client, TABLE_NAME, [word_key(i) for i in range(10)], time_budget_seconds=0
+    )
+
+    assert len(items) == 5
+    assert unprocessed == [word_key(i) for i in range(5)]
+
+
+def test_batch_write_items_writes_in_chunks_of_25():
+    client = ThrottledDynamoDB()
+    items = [word_key(i) for i in range(60)]
+
+    unprocessed = ddb.batch_write_items(
+        client, TABLE_NAME, items, 2, limiter=UnlimitedRate()
+    )
+
+    assert [len(chunk) for chunk in client.write_requests] == [25, 25, 10]
+    assert client.written == items
+    assert unprocessed == []
+
+
+def test_batch_write_items_retries_unprocessed_items():
+    client = ThrottledDynamoDB(unprocessed_per_call=5, throttled_calls=4)
+    items = [word_key(i) for i in range(30)]
+
+    unprocessed = ddb.batch_write_items(
+        client, TABLE_NAME, items, 2, limiter=UnlimitedRate()
+    )
+
+    assert sorted(item["sk"]["S"] for item in client.written) == sorted(
+        item["sk"]["S"] for item in items
+    )
+    assert unprocessed == []
+
+
+def test_batch_write_items_paces_every_chunk():
+    client = ThrottledDynamoDB(unprocessed_per_call=3, throttled_calls=1)
+    acquired = []
+
+    class RecordingLimiter:
+        def acquire(self, count):
+            acquired.append(count)
+
+    ddb.batch_write_items(
+        client,
+        TABLE_NAME,
+        [word_key(i) for i in range(30)],
+        2,
+        limiter=RecordingLimiter(),
+    )
+
+    assert acquired == [25, 5, 3]
+
+
+def test_batch_write_items_returns_unprocessed_items_after_the_time_budget():
+    client = ThrottledDynamoDB(unprocessed_per_call=2)
+
+    unprocessed = ddb.batch_write_items(
+        client,
+        TABLE_NAME,
+        [word_key(i) for i in range(4)],
+        2,
+        time_budget_seconds=0,
+        limiter=UnlimitedRate(),
+    )
+
+    assert unprocessed == [{"PutRequest": {"Item": word_key(i)}} for i in range(2)]
@@ -0,0 +1,79 @@
+import pytest
+
+from spelling_game_backend.languages import LANGUAGES
+
+from .conftest import load_lambda
+
+prepare_generated_words = load_lambda(
+    "prepare_generated_words", {"DDB_TABLE_NAME": "words"}
+)
+
+ALPHABETS = {language.code: language.alphabet for language in LANGUAGES}
+GREEK_ALPHABET = "αβγδεζηθικλμνξοπρστυφχψωάέήίόύώς"
+
+
+def word(text, description="a description"):
+    return {"word": text, "description": description}
+
+
+@pytest.mark.parametrize(
+    "text, alphabet, reason",
+    [
+        ("appel", ALPHABETS["en-US"], None),
+        # Length
+        ("boom", ALPHABETS["en-US"], "WrongLength"),
+        ("vijf", ALPHABETS["nl-NL"], "WrongLength"),
+        ("fietsen", ALPHABETS["nl-NL"], None),
+        ("aardbeien", ALPHABETS["nl-NL"], None),
+        ("aardappels", ALPHABETS["nl-NL"], "WrongLength"),
+        # Single lowercase words
+        ("ice cream", ALPHABETS["en-US"], "NotSingleWord"),
+        ("Apple", ALPHABETS["en-US"], "NotLowercase"),
+        ("TAFEL", ALPHABETS["nl-NL"], "NotLowercase"),
+        # Alphabet of the language
+        ("ruïne", ALPHABETS["nl-NL"], None),
+        ("cafeïne", ALPHABETS["nl-NL"], None),
+        ("ruïne", ALPHABETS["en-US"], "WrongAlphabet"),
+        ("straße", ALPHABETS["nl-NL"], "WrongAlphabet"),
+        ("well-done", ALPHABETS["en-US"], "WrongAlphabet"),
+        ("θάλασσα", GREEK_ALPHABET, None),
+        ("θάλασσα", ALPHABETS["en-US"], "WrongAlphabet"),
+        ("apple", GREEK_ALPHABET, "WrongAlphabet"),
+        # Without an alphabet any letters are allowed
+        ("θάλασσα", None, None),
+    ],
+)
+def test_word_rules(text, alphabet, reason):
+    assert prepare_generated_words.rejection_reason(text, alphabet) == reason
+
+
+def test_filter_words_counts_rejections_by_reason():
+    words = [
+        word("appel"),
+        word("  fiets  ", "  a bicycle "),
+        word("appel", "an apple again"),
+        word("tafel", "   "),
+        word("boom"),
+        word("Stoel"),
+        word("ice cream"),
+    ]
+
+    valid, rejected = prepare_generated_words.filter_words(words, ALPHABETS["en-US"])
+
+    assert valid == [word("appel"), word("fiets", "a bicycle")]
+    assert rejected == {
+        "Duplicate": 1,
+        "NoDescription": 1,
+        "WrongLength": 1,
+        "NotLowercase": 1,
+        "NotSingleWord": 1,
+    }
+
+
+def test_a_rejected_word_is_no_duplicate():
+    words = [word("tafel", ""), word("tafel")]
+
+    valid, rejected = prepare_generated_words.filter_words(words, ALPHABETS["nl-NL"])
+
+    assert valid == [word("tafel")]
+    assert rejected == {"NoDescription": 1}
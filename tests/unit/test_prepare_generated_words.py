@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from .conftest import load_lambda
+
+prepare_generated_words = load_lambda(
+    "prepare_generated_words", {"DDB_TABLE_NAME": "words"}
+)
+
+
+def word(text, description="a description"):
+    return {"word": text, "description": description}
+
+
+WORDS = [word("appel", "a fruit"), word("fiets", "a bicycle"), word("tafel", "a table")]
+
+
+def test_parse_words():
+    assert prepare_generated_words.parse_words(json.dumps(WORDS)) == WORDS
+
+
+def test_parse_words_after_prose():
+    text = "Here are the words you asked for:\n\n" + json.dumps(WORDS, indent=2)
+
+    assert prepare_generated_words.parse_words(text) == WORDS
+
+
+@pytest.mark.parametrize(
+    "cut, expected",
+    [
+        # Only the closing bracket is missing
+        (1, WORDS),
+        (2, WORDS[:2]),
+        (10, WORDS[:2]),
+        (len(json.dumps(WORDS[2])) + 2, WORDS[:2]),
+    ],
+)
+def test_parse_words_keeps_the_words_before_a_truncated_tail(cut, expected):
+    text = json.dumps(WORDS)[:-cut]
+
+    assert prepare_generated_words.parse_words(text) == expected
+
+
+@pytest.mark.parametrize(
+    "malformed",
+    [
+        '{"word": "stoel" "description": "a chair"}',
+        '{"word": "stoel"}',
+        '{"word": 42, "description": "a number"}',
+        '"stoel"',
+    ],
+)
+def test_parse_words_skips_a_malformed_element(malformed):
+    text = (
+        f"[{json.dumps(WORDS[0])}, {malformed}, "
+        f"{json.dumps(WORDS[1])}, {json.dumps(WORDS[2])}]"
+    )
+
+    assert prepare_generated_words.parse_words(text) == WORDS
+
+
+def test_parse_words_without_an_array():
+    assert prepare_generated_words.parse_words("I can't help with that.") == []
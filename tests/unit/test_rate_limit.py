@@ -0,0 +1,145 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from words_common import rate_limit
+
+TABLE_NAME = "rate-limits"
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class BucketTable:
+    """Stub client keeping one bucket item, with DynamoDB's conditional writes."""
+
+    def __init__(self, tokens=None, updated_at=None, concurrent_claims=0):
+        self.item = None
+        if tokens is not None:
+            self.item = {
+                "tokens": {"N": repr(tokens)},
+                "updated_at": {"N": repr(updated_at)},
+            }
+        # Claims of other writers landing between a read and its update
+        self.concurrent_claims = concurrent_claims
+        self.updates = []
+
+    def get_item(self, TableName, Key, ConsistentRead):
+        assert ConsistentRead
+        return {"Item": dict(self.item)} if self.item else {}
+
+    def update_item(
+        self,
+        TableName,
+        Key,
+        UpdateExpression,
+        ConditionExpression,
+        ExpressionAttributeValues,
+    ):
+        self.updates.append(ExpressionAttributeValues)
+        if self.concurrent_claims:
+            self.concurrent_claims -= 1
+            self.item["updated_at"] = {
+                "N": repr(float(self.item["updated_at"]["N"]) + 0.001)
+            }
+        if ConditionExpression == "attribute_not_exists(pk)":
+            met = self.item is None
+        else:
+            met = (
+                self.item is not None
+                and self.item["updated_at"] == ExpressionAttributeValues[":updated_at"]
+            )
+        if not met:
+            raise ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+            )
+        self.item = {
+            "tokens": ExpressionAttributeValues[":tokens"],
+            "updated_at": ExpressionAttributeValues[":now"],
+        }
+
+    def tokens(self):
+        return float(self.item["tokens"]["N"])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "time", clock.time)
+    monkeypatch.setattr(rate_limit.time, "sleep", clock.sleep)
+    monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: 0.01)
+    return clock
+
+
+def limiter(table, rate=2, burst=10):
+    return rate_limit.SharedRateLimiter(
+        table, TABLE_NAME, "dynamodb-writes", rate, burst=burst
+    )
+
+
+def test_a_new_bucket_starts_full(clock):
+    table = BucketTable()
+
+    limiter(table).acquire(3)
+
+    assert table.tokens() == 7
+    assert clock.slept == []
+
+
+def test_tokens_refill_at_the_rate_up_to_the_burst(clock):
+    # Two seconds at 2 per second since the bucket was emptied
+    table = BucketTable(tokens=0, updated_at=clock.now - 2)
+
+    limiter(table).acquire(3)
+    assert table.tokens() == 1
+
+    # Refilling never goes past the burst size
+    clock.now += 100
+    limiter(table).acquire(1)
+    assert table.tokens() == 9
+
+
+def test_waits_for_the_missing_tokens(clock):
+    table = BucketTable(tokens=1, updated_at=clock.now)
+
+    limiter(table).acquire(4)
+
+    assert clock.slept == [1.5]
+    assert table.tokens() == 0
+
+
+def test_retries_after_a_concurrent_claim(clock):
+    table = BucketTable(tokens=5, updated_at=clock.now, concurrent_claims=1)
+
+    limiter(table).acquire(2)
+
+    # The first update lost the race and was read and written again
+    assert len(table.updates) == 2
+    assert table.tokens() == pytest.approx(3, abs=0.1)
+
+
+def test_claims_only_the_tokens_needed(clock):
+    table = BucketTable()
+
+    limiter(table).acquire(1)
+
+    assert table.tokens() == 9
+
+
+def test_a_claim_bigger_than_the_burst_is_split(clock):
+    table = BucketTable()
+
+    limiter(table, rate=2, burst=10).acquire(15)
+
+    assert [float(update[":tokens"]["N"]) for update in table.updates] == [0, 0]
+    # The second claim waits for five tokens to refill
+    assert clock.slept == [2.5]
@@ -0,0 +1,128 @@
+import random
+from collections import Counter
+
+import pytest
+
+from words_common import sampling
+
+TABLE_NAME = "words"
+INDEX_NAME = "SamplingIndex"
+
+
+class FakeDynamoDB:
+    """Words pool of one language, queried through the slot sampling index.
+
+    Words without a slot, saved before sampling by slot, are only found by
+    querying the table itself.
+    """
+
+    def __init__(self, slots, unslotted=()):
+        self.slots = slots
+        self.unslotted = [
+            {"pk": {"S": "Word#nl-NL"}, "sk": {"S": f"{i:032x}"}, "word": {"S": word}}
+            for i, word in enumerate(unslotted)
+        ]
+        self.slot_count = max(slots) + 1 if slots else 0
+
+    def get_item(self, TableName, Key, ProjectionExpression=None):
+        if not self.slot_count:
+            return {}
+        return {"Item": {"slot_count": {"N": str(self.slot_count)}}}
+
+    def query(
+        self,
+        TableName,
+        KeyConditionExpression,
+        ExpressionAttributeValues,
+        Limit,
+        IndexName=None,
+    ):
+        if IndexName is None:
+            items = [self.item(s) for s in self.slots] + self.unslotted
+            items.sort(key=lambda item: item["sk"]["S"])
+            if "sk >= :sk" in KeyConditionExpression:
+                start = ExpressionAttributeValues[":sk"]["S"]
+                items = [item for item in items if item["sk"]["S"] >= start]
+            return {"Items": items[:Limit]}
+
+        slot = ExpressionAttributeValues.get(":slot")
+        if "slot = :slot" in KeyConditionExpression:
+            matched = [s for s in self.slots if s == int(slot["N"])]
+        elif "slot >= :slot" in KeyConditionExpression:
+            matched = [s for s in self.slots if s >= int(slot["N"])]
+        else:
+            matched = list(self.slots)
+        return {"Items": [self.item(s) for s in sorted(matched)[:Limit]]}
+
+    @staticmethod
+    def item(slot):
+        return {
+            "pk": {"S": "Word#nl-NL"},
+            "sk": {"S": f"id{slot:030d}"},
+            "word": {"S": f"word{slot}"},
+            "slot": {"N": str(slot)},
+        }
+
+
+@pytest.fixture(autouse=True)
+def clear_slot_counts():
+    sampling._slot_counts.clear()
+    random.seed(1)
+
+
+def draw(client, count):
+    return sampling.sample_words(client, TABLE_NAME, INDEX_NAME, "nl-NL", count)
+
+
+def test_every_word_is_equally_likely():
+    # Empty slots, as left by words saved twice, must not favour their neighbours
+    slots = [0, 1, 2, 5, 6, 7, 8, 12, 13, 14, 15, 16, 20, 21, 22, 25, 26, 27, 28, 29]
+    client = FakeDynamoDB(slots)
+
+    draws = 20000
+    counts = Counter(
+        item["word"]["S"] for _ in range(draws) for item in draw(client, 1)
+    )
+
+    expected = draws / len(slots)
+    assert len(counts) == len(slots)
+    assert max(counts.values()) < expected * 1.15
+    assert min(counts.values()) > expected * 0.85
+
+
+def test_questions_are_distinct():
+    client = FakeDynamoDB(list(range(30)))
+
+    for _ in range(200):
+        words = [item["word"]["S"] for item in draw(client, 10)]
+        assert len(words) == 10
+        assert len(set(words)) == 10
+
+
+def test_every_word_when_the_pool_is_smaller():
+    client = FakeDynamoDB([0, 2, 3])
+
+    assert sorted(item["word"]["S"] for item in draw(client, 5)) == [
+        "word0",
+        "word2",
+        "word3",
+    ]
+
+
+def test_empty_pool():
+    assert draw(FakeDynamoDB([]), 5) == []
+
+
+def test_words_without_a_slot_fill_a_short_set():
+    # Right after deploy, only words saved since have a slot
+    client = FakeDynamoDB([0], unslotted=["appel", "peer", "druif", "kers"])
+
+    for _ in range(50):
+        words = [item["word"]["S"] for item in draw(client, 5)]
+        assert sorted(words) == ["appel", "druif", "kers", "peer", "word0"]
+
+
+def test_words_without_a_slot_when_none_has_one():
+    client = FakeDynamoDB([], unslotted=["appel", "peer", "druif"])
+
+    assert len(draw(client, 2)) == 2
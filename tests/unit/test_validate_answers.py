@@ -0,0 +1,29 @@
+import hashlib
+
+import pytest
+
+from .conftest import load_lambda
+
+validate_answers = load_lambda("validate_answers", {"DDB_TABLE_NAME": "words"})
+
+
+def saved_id(word):
+    return hashlib.md5(word.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "answer",
+    [
+        "cafeïne",
+        # i followed by a combining diaeresis
+        "cafei\u0308ne",
+        "Cafeïne",
+        "  cafeïne ",
+    ],
+)
+def test_answers_hash_to_the_saved_word_id(answer):
+    assert validate_answers.word_id(answer) == saved_id("cafeïne")
+
+
+def test_a_wrong_answer_has_another_id():
+    assert validate_answers.word_id("cafeine") != saved_id("cafeïne")